@@ -22,9 +22,9 @@ bl_info = {
 # Imports
 from cmath import inf
 from math import pow
-from copy import deepcopy
 from datetime import datetime
-from collections import deque
+from operator import itemgetter
+import heapq
 from abc import ABC, abstractmethod
 import xml.etree.ElementTree as ET
 import numpy
@@ -32,7 +32,6 @@ import bpy
 import bmesh
 import functools
 from mathutils.geometry import distance_point_to_plane
-from mathutils.geometry import intersect_line_plane
 from mathutils.geometry import normal as get_normal
 from mathutils import Vector
 from mathutils import Matrix
@@ -40,6 +39,20 @@ from bpy_extras import view3d_utils
 from bpy_extras import object_utils
 import traceback
 
+# Numba is optional (it is not bundled with Blender),
+# without it the kernels decorated by njit run as plain Python functions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the decorated function unchanged
+        """
+        if len(args) == 1 and callable(args[0]) and len(kwargs) == 0:
+            return args[0]
+        return lambda function: function
+
 #
 # Global settings
 #
@@ -48,6 +61,12 @@ VERT_DECIMALS = 5
 PLANE_DISTANCE_THRESHOLD = 0.001
 POLYGON_CULL_THRESHOLD = 1E-6
 POLYGON_CUT_PRECISION = 1000.0
+# Cost of a cut polygon compared to a polygon that stays whole when choosing BSP splitters
+BSP_SPLIT_PENALTY = 5
+# Maximum number of polygons used to score a BSP splitter candidate
+BSP_SPLITTER_SAMPLE_SIZE = 64
+# Size of the output file write buffer in bytes
+SVG_WRITE_BUFFER_SIZE = 1 << 20
 
 MATERIAL_PREFIX = "bl_mat_"
 RENAMED_MATERIAL_PREFIX = "bl_matrenamed_"
@@ -226,6 +245,28 @@ def get_rgb_val_from_linear(c):
     color = max(0.0, c * 12.92) if c < 0.0031308 else 1.055 * pow(c, 1.0 / 2.4) - 0.055
     return (max(min(int(color * 255 + 0.5), 255), 0))
 
+# Formatted svg colors of already seen rgb values, lit polygons share a small set of colors
+rgb_string_cache = dict()
+
+def get_rgb_string(rgb):
+    """Converts 0-255 RGB values to an svg hex color string, 
+    every color is formatted only once and then taken from the cache
+
+    :param rgb: Red, green and blue value (0-255)
+    :type rgb: bytes
+    :return: Svg color string (#rrggbb)
+    :rtype: str
+    """
+    rgb_string = rgb_string_cache.get(rgb)
+    if rgb_string is None:
+        rgb_string = "#" + rgb.hex()
+        rgb_string_cache[rgb] = rgb_string
+    return rgb_string
+
+# Formatted svg fill and stroke attributes of already seen polygon styles, 
+# see ViewPolygon.get_svg_style_attributes()
+style_attributes_cache = dict()
+
 #
 # PROPERTIES
 #
@@ -903,7 +944,7 @@ class ExportSVGProperties(bpy.types.PropertyGroup):
         name = "Coordinates precision",
         description = "Number of decimals that the resulting coordinates will be rounded to " + \
             "in the svg file, lesser precision results in a smaller svg file",
-        default = 5,
+        default = 2,
         min = 1,
         max = 15
     )
@@ -1865,6 +1906,8 @@ class BSPNode:
     """Class representing a BSP Node
     """
 
+    __slots__ = ("front_node", "back_node", "is_leaf", "polygon_list")
+
     def __init__(self):
         """Constructor method
         """
@@ -1879,6 +1922,9 @@ class BSPNode:
 
 class ViewType(ABC):
 
+    # Subclasses without __slots__ still get __dict__, ViewPolygon defines its own slots
+    __slots__ = ()
+
     @abstractmethod
     def to_svg(self, precision):
         pass
@@ -1891,17 +1937,23 @@ class ViewPolygon(ViewType):
     """Class representing a polygon in viewport
     """
 
+    # Instances are created in large numbers, slots avoid a __dict__ per polygon
+    __slots__ = ("verts", "depth", "rgb_color", "opacity", "material_name",
+                 "ignored_lighting", "stroke_equals_fill", "normal", "plane", "marked", "bounds",
+                 "circle", "points")
+
     def __init__(self, verts, depth, rgb_color, opacity, 
                  set_bounds=False, material_name="", 
-                 ignored_lighting=False, stroke_equals_fill=False):
+                 ignored_lighting=False, stroke_equals_fill=False, set_normal=True,
+                 normal=None):
         """Constructor method of ViewPolygon type
 
         :param verts: Vertices of the polygon
-        :type verts: List of float[3]
+        :type verts: List of float[3] or numpy.ndarray of shape (n, 3)
         :param depth: Depth of the polygon
         :type depth: float
-        :param rgb_color: Color of the polygon
-        :type rgb_color: float[3]
+        :param rgb_color: Color of the polygon (0.0-1.0), stored as 3 bytes (0-255)
+        :type rgb_color: float[3] or None
         :param opacity: Opacity of the polygon
         :type opacity: float
         :param set_bounds: Calculates bounds of the polygon if True, defaults to False
@@ -1914,32 +1966,83 @@ class ViewPolygon(ViewType):
         :param stroke_equals_fill: True if the stroke of this polygon is 
         supposed to be the same as the fill, defaults to False
         :type stroke_equals_fill: bool, optional
+        :param set_normal: Calculates normal of the polygon if True, otherwise the normal is None 
+        until it is set (see calculate_normals()), defaults to True
+        :type set_normal: bool, optional
+        :param normal: Already known normal of the polygon, used instead of calculating it 
+        (set_normal is then ignored), defaults to None
+        :type normal: float[3] or None, optional
         """
-        # vert = (x, y, z)
-        self.verts = verts
+        # vert = (x, y, z), stored as a contiguous (n, 3) array for vectorized calculations
+        self.verts = numpy.ascontiguousarray(verts, dtype=numpy.float64).reshape(-1, 3)
         self.depth = depth
-        # rgb = (r, g, b)
-        self.rgb_color = rgb_color
+        # rgb = (r, g, b), quantized once to the 0-255 values written into the SVG
+        self.rgb_color = None
+        if rgb_color is not None:
+            self.rgb_color = bytes(get_rgb_val(c) for c in rgb_color[:3])
         self.opacity = opacity
         self.material_name = material_name
         self.ignored_lighting = ignored_lighting
         self.stroke_equals_fill = stroke_equals_fill
-        self.normal = get_normal(verts)
+        # Normal as an array, only replaced (never modified in place) when it changes
+        self.normal = None
+        if normal is not None:
+            self.normal = numpy.array(normal, dtype=numpy.float64)
+        elif set_normal:
+            self.normal = numpy.array(get_normal(verts), dtype=numpy.float64)
+        # Cached (unit normal, offset) pair, see get_plane()
+        self.plane = None
         # Newell marked
         self.marked = False
         # Bounding box [xMin, xMax, yMin, yMax, zMin, zMax]
-        self.bounds = [0, 0, 0, 0, 0, 0]
+        self.bounds = numpy.zeros(6, dtype=numpy.float64)
         if set_bounds:
-            self.bounds = [verts[0][0], verts[0][0],
-                           verts[0][1], verts[0][1],
-                           verts[0][2], verts[0][2]]
-            for vert in self.verts:
-                self.bounds[0] = min(vert[0], self.bounds[0])
-                self.bounds[1] = max(vert[0], self.bounds[1])
-                self.bounds[2] = min(vert[1], self.bounds[2])
-                self.bounds[3] = max(vert[1], self.bounds[3])
-                self.bounds[4] = min(vert[2], self.bounds[4])
-                self.bounds[5] = max(vert[2], self.bounds[5])
+            self.bounds = ViewPolygon.compute_bounds(self.verts)
+        # Cached bounding circle of the projection, see get_circle()
+        self.circle = None
+        # Svg points string set by MeshConverter from preformatted mesh vertices,
+        # None if the points are formatted from the verts (see get_svg_points())
+        self.points = None
+
+    def get_svg_points(self, precision):
+        """Converts 2D vertices of this polygon to the value of svg points attribute, 
+        returns the preformatted points if they were set (formatted with the same precision)
+
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :return: String of space separated "x,y" pairs
+        :rtype: str
+        """
+        if self.points is not None:
+            return self.points
+        return ViewPolygon.format_svg_points(self.verts[:, :2], precision)
+
+    @staticmethod
+    def format_svg_points(coords_2d, precision):
+        """Converts 2D coordinates to the value of svg points attribute
+
+        :param coords_2d: X and y of every point
+        :type coords_2d: numpy.ndarray of shape (n, 2)
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :return: String of space separated "x,y" pairs
+        :rtype: str
+        """
+        # tolist() converts all coordinates to Python floats at once, they are rounded 
+        # by the builtin round() (numpy.round() rounds some half-way values differently,
+        # e.g. 270.85 to 270.8 instead of 270.9, which would change the output)
+        coords = coords_2d.ravel().tolist()
+        if len(coords) == 0:
+            return ""
+        coords = map(round, coords, [precision] * len(coords))
+        # Formats every coordinate by one map() call (repr() is the same as the f-string format)
+        # and joins them into "x,y " pairs without a Python loop
+        coord_strings = list(map(repr, coords))
+        points = " ".join(map(",".join, zip(coord_strings[0::2], coord_strings[1::2]))) + " "
+        # repr() never writes trailing zeros except for whole numbers ("2.0"), 
+        # every coordinate is followed by "," or " " so those can be stripped by two replaces,
+        # the last space is removed afterwards
+        return points.replace(".0,", ",").replace(".0 ", " ")[:-1]
 
     def to_svg_shape_only(self, precision):
         """Converts this viewport object to svg formatted string without attributes (like color)
@@ -1949,55 +2052,89 @@ class ViewPolygon(ViewType):
         :return: String in svg format defining the ViewPolygon
         :rtype: str
         """
-        polygon_string = "   <polygon points=\""
-
         # Prints 2D vertices in a sequence as a polygon
-        for vert in self.verts:
-            polygon_string += f"{round(vert[0], precision)},{round(vert[1], precision)} "
+        return f"<polygon points=\"{self.get_svg_points(precision)}\"/>\n"
 
-        polygon_string += f"\" />\n"
+    def has_same_style(self, other):
+        """Checks whether two lit polygons have the same svg style attributes 
+        (compared directly, no key is allocated for every polygon)
 
-        return polygon_string
+        :param other: Compared polygon
+        :type other: ViewPolygon
+        :return: True if both polygons are lit and their attributes are equal, False otherwise
+        :rtype: bool
+        """
+        return (not self.ignored_lighting and not other.ignored_lighting and
+                self.rgb_color == other.rgb_color and self.opacity == other.opacity and
+                self.stroke_equals_fill == other.stroke_equals_fill)
 
-    def to_svg(self, precision):
-        """Converts this viewport object to svg formatted string
+    def get_svg_style_attributes(self):
+        """Converts the lit colour of this polygon to svg fill and stroke attributes, 
+        every combination of the attributes is formatted only once and then taken from the cache
+
+        :return: String of svg attributes starting with a space, empty if lighting is ignored
+        :rtype: str
+        """
+        # Sets custom colour and opacity of the polygons only if lighting is active, 
+        # otherwise uses material
+        if self.ignored_lighting:
+            return ""
+
+        style_key = (self.rgb_color, self.opacity, self.stroke_equals_fill)
+        attributes = style_attributes_cache.get(style_key)
+        if attributes is None:
+            attributes = self.format_svg_style_attributes()
+            style_attributes_cache[style_key] = attributes
+        return attributes
+
+    def format_svg_style_attributes(self):
+        """Formats the svg fill and stroke attributes of a lit polygon 
+        (see get_svg_style_attributes())
+
+        :return: String of svg attributes starting with a space
+        :rtype: str
+        """
+        rgb_string = get_rgb_string(self.rgb_color)
+        attribute_parts = [f" fill=\"{rgb_string}\""]
+        # Opacity is formatted once and shared by the fill and the stroke
+        opacity_string = None
+        if self.opacity != 1.0:
+            opacity_string = str(round(self.opacity, 4))
+            attribute_parts.append(f" fill-opacity=\"{opacity_string}\"")
+        
+        # Sets custom colour and opacity of strokes only if lighting is active and 
+        # strokes are same as fills, otherwise uses material
+        if self.stroke_equals_fill:
+            attribute_parts.append(f" stroke=\"{rgb_string}\"")
+            if opacity_string is not None:
+                attribute_parts.append(f" stroke-opacity=\"{opacity_string}\"")
+
+        return "".join(attribute_parts)
+
+    def to_svg_class_only(self, precision):
+        """Converts this viewport object to svg formatted string without the style attributes, 
+        used for polygons inside a <g> element that sets them (see get_svg_style_attributes())
 
         :param precision: Number of decimal places for coordinates (1-15)
         :type precision: int
         :return: String in svg format defining the ViewPolygon
         :rtype: str
         """
-        polygon_string = "   <polygon points=\""
+        return f"<polygon points=\"{self.get_svg_points(precision)}\"" \
+               f" class=\"{self.material_name}\"/>\n"
 
-        # Prints 2D vertices in a sequence as a polygon
-        for vert in self.verts:
-            polygon_string += f"{round(vert[0], precision)},{round(vert[1], precision)} "
+    def to_svg(self, precision):
+        """Converts this viewport object to svg formatted string
 
-        # Sets custom colour and opacity of the polygons only if lighting is active, 
-        # otherwise uses material
-        if not self.ignored_lighting:
-            polygon_string += f"\" fill=\"rgb({get_rgb_val(self.rgb_color[0])},"\
-                f"{get_rgb_val(self.rgb_color[1])},"\
-                f"{get_rgb_val(self.rgb_color[2])})\""
-            if self.opacity != 1.0:
-                polygon_string += f" fill-opacity=\"{round(self.opacity, 4)}\" "\
-            
-            # Sets custom colour and opacity of strokes only if lighting is active and 
-            # strokes are same as fills, otherwise uses material
-            if self.stroke_equals_fill:
-                polygon_string += f" stroke="\
-                    f"\"rgb({get_rgb_val(self.rgb_color[0])},"\
-                    f"{get_rgb_val(self.rgb_color[1])},"\
-                    f"{get_rgb_val(self.rgb_color[2])})\""
-
-                if self.opacity != 1.0:
-                    polygon_string += f" stroke-opacity=\"{round(self.opacity, 4)}\" "
-        else:
-            polygon_string += f"\" "
-        
-        polygon_string += f" class=\"{self.material_name}\" />\n"
-            
-        return polygon_string
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :return: String in svg format defining the ViewPolygon
+        :rtype: str
+        """
+        # Prints 2D vertices in a sequence as a polygon followed by its style attributes,
+        # polygons are the bulk of the file so they are written without indentation
+        return f"<polygon points=\"{self.get_svg_points(precision)}\"" \
+               f"{self.get_svg_style_attributes()} class=\"{self.material_name}\"/>\n"
 
     def get_depth(self, option):
         """Gets depth of this element based on its bounding box
@@ -2014,6 +2151,137 @@ class ViewPolygon(ViewType):
         else:
             raise TypeError("Invalid sorting option")
 
+    def clone_with_verts(self, verts):
+        """Creates a shallow copy of this polygon with different vertices 
+        (replacement for deepcopy when cutting, bounds have to be recalculated afterwards)
+
+        :param verts: Vertices of the new polygon
+        :type verts: List of float[3] or numpy.ndarray of shape (n, 3)
+        :return: New polygon with the same attributes as this one
+        :rtype: ViewPolygon
+        """
+        clone = ViewPolygon.__new__(ViewPolygon)
+        clone.verts = numpy.ascontiguousarray(verts, dtype=numpy.float64).reshape(-1, 3)
+        clone.depth = self.depth
+        clone.rgb_color = self.rgb_color
+        clone.opacity = self.opacity
+        clone.material_name = self.material_name
+        clone.ignored_lighting = self.ignored_lighting
+        clone.stroke_equals_fill = self.stroke_equals_fill
+        # Normal arrays are replaced instead of modified (see correct_normals), can be shared
+        clone.normal = self.normal
+        # Fragments lie in the plane of the original polygon
+        clone.plane = self.plane
+        clone.marked = self.marked
+        clone.bounds = self.bounds
+        clone.circle = None
+        clone.points = None
+        return clone
+
+    def set_verts(self, verts):
+        """Replaces the vertices of this polygon in place (used for the fragment that keeps 
+        the original instance when cutting), bounds have to be recalculated afterwards
+
+        :param verts: New vertices of the polygon (in the same plane)
+        :type verts: List of float[3] or numpy.ndarray of shape (n, 3)
+        """
+        self.verts = numpy.ascontiguousarray(verts, dtype=numpy.float64).reshape(-1, 3)
+        # Caches derived from the verts, the plane and normal stay valid
+        self.circle = None
+        self.points = None
+
+    @staticmethod
+    def calculate_normals(view_polygons):
+        """Calculates normals of all the polygons at once using Newell's method 
+        (same orientation as mathutils.geometry.normal)
+
+        :param view_polygons: Polygons to calculate normals of
+        :type view_polygons: List of ViewPolygon
+        """
+        if len(view_polygons) == 0:
+            return
+
+        # Concatenates verts of all polygons and finds the next vert of every vert
+        counts = numpy.array([len(polygon.verts) for polygon in view_polygons])
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+        verts = numpy.concatenate([polygon.verts for polygon in view_polygons])
+        next_indices = numpy.arange(1, len(verts) + 1)
+        next_indices[starts + counts - 1] = starts
+
+        # Sums cross products of all edges of every polygon and normalizes the sums
+        normals = numpy.add.reduceat(numpy.cross(verts, verts[next_indices]), starts)
+        lengths = numpy.linalg.norm(normals, axis=1, keepdims=True)
+        normals /= numpy.where(lengths == 0.0, 1.0, lengths)
+
+        for polygon, normal in zip(view_polygons, normals):
+            polygon.normal = normal
+            polygon.plane = None
+
+    @staticmethod
+    def compute_bounds(verts):
+        """Calculates the bounding box of the verts by one minimum and one maximum reduction
+
+        :param verts: Vertices of a polygon (at least one)
+        :type verts: numpy.ndarray of shape (n, 3)
+        :return: Bounding box [xMin, xMax, yMin, yMax, zMin, zMax]
+        :rtype: numpy.ndarray of shape (6,)
+        """
+        # Interleaves the reductions directly into the result instead of stacking them
+        bounds = numpy.empty(6, dtype=numpy.float64)
+        bounds[0::2] = verts.min(axis=0)
+        bounds[1::2] = verts.max(axis=0)
+        return bounds
+
+    @staticmethod
+    def calculate_bounds(view_polygons):
+        """Calculates bounds of all the polygons at once (same as compute_bounds() for each)
+
+        :param view_polygons: Polygons to calculate bounds of (every one with at least one vert)
+        :type view_polygons: List of ViewPolygon
+        """
+        if len(view_polygons) == 0:
+            return
+
+        # Reduces the concatenated verts of all polygons to per-polygon minimums and maximums
+        counts = numpy.array([len(polygon.verts) for polygon in view_polygons])
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+        verts = numpy.concatenate([polygon.verts for polygon in view_polygons])
+        bounds = numpy.empty((len(view_polygons), 6), dtype=numpy.float64)
+        bounds[:, 0::2] = numpy.minimum.reduceat(verts, starts)
+        bounds[:, 1::2] = numpy.maximum.reduceat(verts, starts)
+
+        for polygon, polygon_bounds in zip(view_polygons, bounds):
+            polygon.bounds = polygon_bounds
+
+    def get_circle(self):
+        """Returns a circle containing the projection of this polygon (x and y of the verts), 
+        the circle is calculated on first use and kept until the verts change
+
+        :return: Center x, center y and radius of the circle
+        :rtype: numpy.ndarray of shape (3,)
+        """
+        if self.circle is None:
+            verts_2d = self.verts[:, :2]
+            center = verts_2d.mean(axis=0)
+            radius = numpy.sqrt(((verts_2d - center) ** 2).sum(axis=1).max())
+            self.circle = numpy.array([center[0], center[1], radius], dtype=numpy.float64)
+        return self.circle
+
+    def get_plane(self):
+        """Returns the plane of this polygon, the plane is calculated on first use 
+        and kept until the normal changes (cutting does not change it, fragments stay in it)
+
+        :return: Unit normal n and offset d of the plane n @ x + d = 0
+        :rtype: (numpy.ndarray of shape (3,), float)
+        """
+        if self.plane is None:
+            normal = numpy.array(self.normal, dtype=numpy.float64)
+            length = numpy.linalg.norm(normal)
+            if length != 0.0:
+                normal /= length
+            self.plane = (normal, -float(normal @ self.verts[0]))
+        return self.plane
+
     @staticmethod
     def recalculate_bounds(view_polygon):
         """Recalculates the bounds of the polygon
@@ -2021,22 +2289,17 @@ class ViewPolygon(ViewType):
         :param view_polygon: Polygon to recalculate
         :type view_polygon: ViewPolygon
         """
-        verts = view_polygon.verts
-        view_polygon.bounds = [verts[0][0], verts[0][0],
-                  verts[0][1], verts[0][1],
-                  verts[0][2], verts[0][2]]
-        for vert in verts:
-            view_polygon.bounds[0] = min(vert[0], view_polygon.bounds[0])
-            view_polygon.bounds[1] = max(vert[0], view_polygon.bounds[1])
-            view_polygon.bounds[2] = min(vert[1], view_polygon.bounds[2])
-            view_polygon.bounds[3] = max(vert[1], view_polygon.bounds[3])
-            view_polygon.bounds[4] = min(vert[2], view_polygon.bounds[4])
-            view_polygon.bounds[5] = max(vert[2], view_polygon.bounds[5])
+        view_polygon.bounds = ViewPolygon.compute_bounds(view_polygon.verts)
+        view_polygon.circle = None
+        view_polygon.points = None
 
 class ViewCurve(ViewType):
     """Class representing a curve in viewport
     """
 
+    # Grease pencils and annotations create one instance per stroke
+    __slots__ = ("bezier_points", "cyclic", "material_name", "curved", "bounds")
+
     def __init__(self, bezier_points, cyclic, material_name, bounds, curved=True):
         """Constructor of the ViewCurve type
 
@@ -2062,37 +2325,75 @@ class ViewCurve(ViewType):
         # Bounding box [0, 0, 0, 0, zMin, zMax] - first 4 currently unused and not calculated
         self.bounds = bounds
 
-    def to_svg_coords_only(self, precision):
-        """Converts this viewport object to svg formatted string with only path commands
+    @staticmethod
+    def format_svg_coords(vectors, precision):
+        """Formats x and y of every vector as "x,y"
 
+        :param vectors: Handles or coordinates of the bezier points
+        :type vectors: List of float[2]
         :param precision: Number of decimal places for coordinates (1-15)
         :type precision: int
-        :return: String in svg format defining the d attribute of the path element
+        :return: "x,y" string of every vector
+        :rtype: List of str
+        """
+        # Flattens x and y of every vector so rounding and formatting is done by 
+        # two map() calls instead of separate f-string expressions per coordinate
+        values = [value for vector in vectors for value in (vector[0], vector[1])]
+        strings = list(map(repr, map(round, values, [precision] * len(values))))
+        return list(map(",".join, zip(strings[0::2], strings[1::2])))
+
+    def get_svg_path_data(self, precision, curved=True):
+        """Creates the value of d attribute of the path element
+
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :param curved: If True, creates curveto commands with control points, 
+        if False, connects the main points with lines, defaults to True
+        :type curved: bool, optional
+        :return: Path commands
         :rtype: str
         """
-        curve_string = ""
         points = self.bezier_points
+        if curved:
+            # Formats handles and coordinates of all points together
+            pairs = self.format_svg_coords([vector for point in points for vector in point], 
+                                           precision)
+            left_handles, right_handles, coords = pairs[0::3], pairs[1::3], pairs[2::3]
+        else:
+            # Straight paths have no handles (grease pencil strokes do not set them)
+            coords = self.format_svg_coords([point[2] for point in points], precision)
+
+        # First point moveto command
+        path_parts = ["M ", coords[0], " "]
 
-        # First point moveto command (points[point_index] [lhandle/rhandle/coord] [x/y/z])
-        curve_string += f"M {round(points[0][2][0], precision)},"\
-                        f"{round(points[0][2][1], precision)} "
+        if curved:
+            # Curveto command for every point other than the first, uses (right handle of previous point, 
+            # left handle of current point, coord of current point)
+            for right_handle, left_handle, coord in zip(right_handles, left_handles[1:], coords[1:]):
+                path_parts += ("C ", right_handle, " ", left_handle, " ", coord, " ")
 
-        # Curveto command for every point other than the first and last
-        for i in range(1, len(points)):
-            # Uses (right handle of previous point, 
-            # left handle of current point, 
-            # coord of current point)
-            curve_string += f"C {round(points[i-1][1][0], precision)},{round(points[i-1][1][1], precision)} "\
-                            f"{round(points[i][0][0], precision)},{round(points[i][0][1], precision)} "\
-                            f"{round(points[i][2][0], precision)},{round(points[i][2][1], precision)} "
+            # If cyclic, connects the last and first points
+            if self.cyclic:
+                path_parts += ("C ", right_handles[-1], " ", left_handles[0], " ", coords[0], " ")
+        else:
+            # Straight line to every point other than the first
+            for coord in coords[1:]:
+                path_parts += (coord, " ")
+
+            if self.cyclic:
+                path_parts += ("M ", coords[0], " ")
 
-        # If cyclic, connects the last and first points
-        if self.cyclic:
-            curve_string += f"C {round(points[-1][1][0], precision)},{round(points[-1][1][1], precision)} "\
-                            f"{round(points[0][0][0], precision)},{round(points[0][0][1], precision)} "\
-                            f"{round(points[0][2][0], precision)},{round(points[0][2][1], precision)} "
+        return "".join(path_parts)
 
-        return curve_string
+    def to_svg_coords_only(self, precision):
+        """Converts this viewport object to svg formatted string with only path commands
+
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :return: String in svg format defining the d attribute of the path element
+        :rtype: str
+        """
+        return self.get_svg_path_data(precision)
 
     def to_svg_shape_only(self, precision):
         """Converts this viewport object to svg formatted string without any other attributes 
@@ -2103,83 +2404,18 @@ class ViewCurve(ViewType):
         :return: String in svg format defining the ViewCurve
         :rtype: str
         """
-        curve_string = "   <path d=\""
-        points = self.bezier_points
-
-        # First point moveto command (points[point_index] [lhandle/rhandle/coord] [x/y/z])
-        curve_string += f"M {round(points[0][2][0], precision)},"\
-                        f"{round(points[0][2][1], precision)} "
-
-        # Curveto command for every point other than the first and last
-        for i in range(1, len(points)):
-            # Uses (right handle of previous point, 
-            # left handle of current point, 
-            # coord of current point)
-            curve_string += f"C {round(points[i-1][1][0], precision)},{round(points[i-1][1][1], precision)} "\
-                            f"{round(points[i][0][0], precision)},{round(points[i][0][1], precision)} "\
-                            f"{round(points[i][2][0], precision)},{round(points[i][2][1], precision)} "
-
-        # If cyclic, connects the last and first points
-        if self.cyclic:
-            curve_string += f"C {round(points[-1][1][0], precision)},{round(points[-1][1][1], precision)} "\
-                            f"{round(points[0][0][0], precision)},{round(points[0][0][1], precision)} "\
-                            f"{round(points[0][2][0], precision)},{round(points[0][2][1], precision)} "
-
-        curve_string += "\" />\n"
-
-        return curve_string
+        return f"   <path d=\"{self.get_svg_path_data(precision)}\" />\n"
 
     def to_svg(self, precision):
         """Converts this viewport object to svg formatted string
 
         :param precision: Number of decimal places for coordinates (1-15)
         :type precision: int
-        :param curved: If True, prints curveto commands along with control points to create a curved path, 
-        if False, creates a straight path connecting individual main points with a line
-        :type curved: bool
         :return: String in svg format defining the ViewCurve
         :rtype: str
         """
-        curve_string = "   <path d=\""
-        points = self.bezier_points
-
-        if self.curved:
-            # First point moveto command (points[point_index] [lhandle/rhandle/coord] [x/y/z])
-            curve_string += f"M {round(points[0][2][0], precision)},"\
-                            f"{round(points[0][2][1], precision)} "
-
-            # Curveto command for every point other than the first and last
-            for i in range(1, len(points)):
-                # Uses (right handle of previous point, 
-                # left handle of current point, 
-                # coord of current point)
-                curve_string += f"C {round(points[i-1][1][0], precision)},{round(points[i-1][1][1], precision)} "\
-                                f"{round(points[i][0][0], precision)},{round(points[i][0][1], precision)} "\
-                                f"{round(points[i][2][0], precision)},{round(points[i][2][1], precision)} "
-        else:
-            # First point moveto command (points[point_index] [lhandle/rhandle/coord] [x/y/z])
-            curve_string += f"M {round(points[0][2][0], precision)},"\
-                            f"{round(points[0][2][1], precision)} "
-
-            # Moveto command for every point other than the first and last
-            for i in range(1, len(points)):
-                curve_string += f"{round(points[i][2][0], precision)},{round(points[i][2][1], precision)} "
-
-        # If cyclic, connects the last and first points
-        if self.cyclic:
-            if self.curved:
-                curve_string += f"C {round(points[-1][1][0], precision)},{round(points[-1][1][1], precision)} "\
-                                f"{round(points[0][0][0], precision)},{round(points[0][0][1], precision)} "\
-                                f"{round(points[0][2][0], precision)},{round(points[0][2][1], precision)} "
-            else:
-                curve_string += f"M {round(points[0][2][0], precision)},"\
-                                f"{round(points[0][2][1], precision)} "
-
-        curve_string += f"\" class=\"{self.material_name}\" "
-
-        curve_string += " />\n"
-
-        return curve_string
+        return f"   <path d=\"{self.get_svg_path_data(precision, self.curved)}\" "\
+               f"class=\"{self.material_name}\"  />\n"
 
     def get_depth(self, option):
         """Gets depth of this element based on its bounding box
@@ -2502,7 +2738,7 @@ class CameraInfo:
     def __init__(self, name, object_list, camera_pos, camera_dir, 
                  view_height, view_width, view_rot, 
                  world_to_viewport, light_pos, light_dir, 
-                 depsgraph, frame_number, is_viewport):
+                 depsgraph, frame_number, is_viewport, world_to_viewport_batch = None):
         """Constructor of the CameraInfo type
 
         :param name: Name of the camera
@@ -2533,11 +2769,17 @@ class CameraInfo:
         :param is_viewport: True if this camera represents the 3D view of the user, 
         False if it represents a camera object
         :type is_viewport: bool
+        :param world_to_viewport_batch: Reference to a function converting an array 
+        of world positions to viewport at once (rows behind the camera are NaN), defaults to None
+        :type world_to_viewport_batch: Reference to a function: 
+        x(coords : numpy.ndarray of shape (n, 3)) : numpy.ndarray of shape (n, 2)
         """
         self.name = name
         self.object_list = object_list
         self.camera_pos = camera_pos
         self.camera_dir = camera_dir
+        # Unit camera direction, depth of a point is then a single dot product
+        self.camera_dir_normalized = Vector(camera_dir).normalized()
         self.view_height = view_height
         self.view_width = view_width
         self.view_rot = view_rot
@@ -2547,6 +2789,10 @@ class CameraInfo:
         self.depsgraph = depsgraph
         self.frame_number = frame_number
         self.is_viewport = is_viewport
+        self.world_to_viewport_batch = world_to_viewport_batch
+        # Class names of polygons with animated materials (kept outside of the view),
+        # filled by SVGFileGenerator.gen_svg_head()
+        self.animated_class_names = set()
 
     @staticmethod
     def view_to_camerainfo(context, object_list):
@@ -2580,6 +2826,24 @@ class CameraInfo:
         world_to_viewport = functools.partial(view3d_utils.location_3d_to_region_2d,
                                               context.region, context.space_data.region_3d)
 
+        # Batch version of the same conversion, projects all points 
+        # with a single multiplication by the perspective matrix
+        region = context.region
+        region_3d = context.space_data.region_3d
+        def batch_conversion(coords):
+            perspective_matrix = numpy.array(region_3d.perspective_matrix, dtype=numpy.float64)
+            if NUMBA_AVAILABLE:
+                return perspective_project_kernel(coords, perspective_matrix,
+                                                  region.width / 2.0, region.height / 2.0)
+            projected = coords @ perspective_matrix[:3, :3].T + perspective_matrix[:3, 3]
+            w = coords @ perspective_matrix[3, :3] + perspective_matrix[3, 3]
+            # Same as location_3d_to_region_2d returning None for w <= 0
+            w = numpy.where(w > 0.0, w, numpy.nan)
+            width_half = region.width / 2.0
+            height_half = region.height / 2.0
+            return numpy.stack((width_half + width_half * (projected[:, 0] / w),
+                                height_half + height_half * (projected[:, 1] / w)), axis=1)
+
         light_pos = camera_pos
         if not props.camera_light and EnumPropertyDictionaries.light_source[props.light_type] == 0:
             light_pos = props.selected_point_light.location
@@ -2598,7 +2862,7 @@ class CameraInfo:
         camera_info = CameraInfo(name, object_list, camera_pos, camera_dir, 
                                  view_height, view_width, view_rot, 
                                  world_to_viewport, light_pos, light_dir, 
-                                 depsgraph, frame_number, True)
+                                 depsgraph, frame_number, True, batch_conversion)
         
         #camera_info.region = context.region
         #camera_info.region_3d = context.space_data.region_3d
@@ -2648,6 +2912,26 @@ class CameraInfo:
 
         world_to_viewport = conversion
 
+        # Batch version of the same conversion, 
+        # follows object_utils.world_to_camera_view for all points at once
+        def batch_conversion(coords):
+            world_to_local = numpy.array(obj.matrix_world.normalized().inverted(),
+                                         dtype=numpy.float64)
+            coords_local = coords @ world_to_local[:3, :3].T + world_to_local[:3, 3]
+            depth = -coords_local[:, 2]
+            frame = obj.data.view_frame(scene=context.scene)
+            min_x, max_x = frame[2].x, frame[1].x
+            min_y, max_y = frame[1].y, frame[0].y
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                # Perspective frame grows with the depth of the point
+                scale = depth / -frame[0].z if obj.data.type != 'ORTHO' else 1.0
+                x = (coords_local[:, 0] - min_x * scale) / ((max_x - min_x) * scale)
+                y = (coords_local[:, 1] - min_y * scale) / ((max_y - min_y) * scale)
+            # Points behind the camera are NaN (conversion() returns None for them)
+            behind = depth <= 0.0
+            return numpy.stack((numpy.where(behind, numpy.nan, x * view_width),
+                                numpy.where(behind, numpy.nan, y * view_height)), axis=1)
+
         light_pos = camera_pos
         if not props.camera_light and EnumPropertyDictionaries.light_source[props.light_type] == 0:
             light_pos = props.selected_point_light.location
@@ -2672,13 +2956,254 @@ class CameraInfo:
         camera_info = CameraInfo(name, object_list, camera_pos, camera_dir, 
                                  view_height, view_width, view_rot, 
                                  world_to_viewport, light_pos, light_dir, 
-                                 depsgraph, frame_number, False)
+                                 depsgraph, frame_number, False, batch_conversion)
 
         #camera_info.scene = context.scene
         #camera_info.obj = obj
 
         return camera_info
         
+#
+# NUMERIC KERNELS
+#
+
+@njit(cache=True, fastmath=True)
+def intersect_on_axis_kernel(axis, value, x0, y0, z0, x1, y1, z1):
+    """Scalar kernel of ViewPortClipping.intersect_on_x(), intersect_on_y() and intersect_on_z(),
+    the line is intersected where its coordinate on the axis equals the value
+
+    :param axis: Index of the fixed coordinate (0 for x, 1 for y, 2 for z)
+    :type axis: int
+    :param value: Value of the fixed coordinate
+    :type value: float
+    :return: Intersection (the fixed coordinate is exactly the value)
+    :rtype: float[3]
+    """
+    start = (x0, y0, z0)
+    end = (x1, y1, z1)
+    t = (value - start[axis]) / (end[axis] - start[axis])
+    return (value if axis == 0 else x0 + t * (x1 - x0),
+            value if axis == 1 else y0 + t * (y1 - y0),
+            value if axis == 2 else z0 + t * (z1 - z0))
+
+# No fastmath, NaN marks points behind the camera
+@njit(cache=True)
+def perspective_project_kernel(coords, perspective_matrix, width_half, height_half):
+    """Projects points to the region of the 3D view in a single loop, 
+    same as view3d_utils.location_3d_to_region_2d() for every point 
+    (points behind the view are NaN instead of None)
+
+    :param coords: Positions of the points in world coordinates
+    :type coords: numpy.ndarray of shape (n, 3)
+    :param perspective_matrix: Perspective matrix of the 3D view region
+    :type perspective_matrix: numpy.ndarray of shape (4, 4)
+    :param width_half: Half of the region width
+    :type width_half: float
+    :param height_half: Half of the region height
+    :type height_half: float
+    :return: Region positions of the points
+    :rtype: numpy.ndarray of shape (n, 2)
+    """
+    locs = numpy.empty((coords.shape[0], 2))
+    for i in range(coords.shape[0]):
+        x, y, z = coords[i, 0], coords[i, 1], coords[i, 2]
+        w = (perspective_matrix[3, 0] * x + perspective_matrix[3, 1] * y +
+             perspective_matrix[3, 2] * z + perspective_matrix[3, 3])
+        if w > 0.0:
+            locs[i, 0] = width_half + width_half * (perspective_matrix[0, 0] * x +
+                                                    perspective_matrix[0, 1] * y +
+                                                    perspective_matrix[0, 2] * z +
+                                                    perspective_matrix[0, 3]) / w
+            locs[i, 1] = height_half + height_half * (perspective_matrix[1, 0] * x +
+                                                      perspective_matrix[1, 1] * y +
+                                                      perspective_matrix[1, 2] * z +
+                                                      perspective_matrix[1, 3]) / w
+        else:
+            locs[i, 0] = numpy.nan
+            locs[i, 1] = numpy.nan
+    return locs
+
+# No fastmath, NaN marks points behind the camera
+@njit(cache=True)
+def view_coords_kernel(coords, vert_locs, camera_pos, camera_dir, view_height):
+    """Combines viewport positions with depths of the points in a single loop, 
+    see MeshConverter.project_verts()
+
+    :param coords: Positions of the points in world coordinates
+    :type coords: numpy.ndarray of shape (n, 3)
+    :param vert_locs: Viewport positions of the points
+    :type vert_locs: numpy.ndarray of shape (n, 2)
+    :param camera_pos: Position of the camera in world coordinates
+    :type camera_pos: numpy.ndarray of shape (3,)
+    :param camera_dir: Direction of the camera in world coordinates
+    :type camera_dir: numpy.ndarray of shape (3,)
+    :param view_height: Height of the camera's viewport
+    :type view_height: float
+    :return: Rows (x, flipped y, depth)
+    :rtype: numpy.ndarray of shape (n, 3)
+    """
+    dir_length = numpy.sqrt(camera_dir[0] * camera_dir[0] + camera_dir[1] * camera_dir[1] +
+                            camera_dir[2] * camera_dir[2])
+    view_coords = numpy.empty((coords.shape[0], 3))
+    for i in range(coords.shape[0]):
+        view_coords[i, 0] = vert_locs[i, 0]
+        view_coords[i, 1] = view_height - vert_locs[i, 1]
+        view_coords[i, 2] = ((coords[i, 0] - camera_pos[0]) * camera_dir[0] +
+                             (coords[i, 1] - camera_pos[1]) * camera_dir[1] +
+                             (coords[i, 2] - camera_pos[2]) * camera_dir[2]) / dir_length
+    return view_coords
+
+@njit(cache=True, fastmath=True)
+def perimeter_l1_kernel(verts):
+    """Sums absolute coordinate differences of all consecutive verts, 
+    see DepthSorter.is_fragment()
+
+    :param verts: Vertices of the polygon
+    :type verts: numpy.ndarray of shape (n, 3)
+    :return: Sum of the differences
+    :rtype: float
+    """
+    difference_sum = 0.0
+    for i in range(verts.shape[0] - 1):
+        difference_sum += (abs(verts[i + 1, 0] - verts[i, 0]) +
+                           abs(verts[i + 1, 1] - verts[i, 1]) +
+                           abs(verts[i + 1, 2] - verts[i, 2]))
+    return difference_sum
+
+@njit(cache=True, fastmath=True)
+def relative_pos_kernel(verts, starts, normal, offset, threshold):
+    """Classifies polygons by the side of a plane they lie on in one pass over their verts, 
+    see DepthSorter.relative_pos_batch()
+
+    :param verts: Verts of all polygons (from DepthSorter.stack_verts())
+    :type verts: numpy.ndarray of shape (n, 3)
+    :param starts: Index of the first vert of every polygon
+    :type starts: numpy.ndarray of int
+    :param normal: Unit normal of the plane
+    :type normal: numpy.ndarray of shape (3,)
+    :param offset: Offset of the plane
+    :type offset: float
+    :param threshold: Distance from the plane under which verts lie in the plane
+    :type threshold: float
+    :return: -1 if behind the plane, 0 if in collision, 1 if in front, for every polygon
+    :rtype: numpy.ndarray of int
+    """
+    polygon_count = starts.shape[0]
+    positions = numpy.empty(polygon_count, dtype=numpy.int64)
+    for i in range(polygon_count):
+        end = starts[i + 1] if i + 1 < polygon_count else verts.shape[0]
+        any_back = False
+        any_front = False
+        for j in range(starts[i], end):
+            distance = (verts[j, 0] * normal[0] + verts[j, 1] * normal[1] +
+                        verts[j, 2] * normal[2] + offset)
+            if distance <= -threshold:
+                any_back = True
+            elif distance >= threshold:
+                any_front = True
+            # Verts on both sides, the rest of the polygon cannot change the result
+            if any_back and any_front:
+                break
+        if not any_back:
+            positions[i] = 1
+        elif not any_front:
+            positions[i] = -1
+        else:
+            positions[i] = 0
+    return positions
+
+@njit(cache=True, fastmath=True)
+def backface_kernel(first_verts, face_normals, camera_pos):
+    """Checks which faces are backfaces in a single loop without temporary arrays, 
+    see MeshConverter.get_backfaces()
+
+    :param first_verts: First vertex of every face in world coordinates
+    :type first_verts: numpy.ndarray of shape (n, 3)
+    :param face_normals: Normal of every face in world coordinates
+    :type face_normals: numpy.ndarray of shape (n, 3)
+    :param camera_pos: Position of the camera in world coordinates
+    :type camera_pos: numpy.ndarray of shape (3,)
+    :return: Array with True for every backface, False otherwise
+    :rtype: numpy.ndarray of bool
+    """
+    face_count = first_verts.shape[0]
+    backfaces = numpy.empty(face_count, dtype=numpy.bool_)
+    for i in range(face_count):
+        backfaces[i] = ((first_verts[i, 0] - camera_pos[0]) * face_normals[i, 0] +
+                        (first_verts[i, 1] - camera_pos[1]) * face_normals[i, 1] +
+                        (first_verts[i, 2] - camera_pos[2]) * face_normals[i, 2]) >= 0
+    return backfaces
+
+@functools.lru_cache(maxsize=None)
+def make_clip_kernel(axis, is_max):
+    """Returns a clipping pass specialized for one edge of a rectangular boundary,
+    each (axis, is_max) pair is compiled once and reused by every later call
+
+    :param axis: Index of the clipped coordinate (0 for x, 1 for y, 2 for z)
+    :type axis: int
+    :param is_max: True if the edge is the maximum allowed value, False if minimum
+    :type is_max: bool
+    :return: Function taking (limit, verts_2d) and returning the clipped verts
+    :rtype: Callable[[float, numpy.ndarray], numpy.ndarray]
+    """
+    # A plain Python loop would be slower than the vectorized NumPy pass
+    if not NUMBA_AVAILABLE:
+        return lambda limit, verts_2d: ViewPortClipping.clip_to_edge(verts_2d, axis, limit, is_max)
+
+    # axis and is_max are frozen as constants, so Numba drops the unused branches
+    # (closures are not cached on disk, the kernel is compiled once per session)
+    @njit(fastmath=True)
+    def clip_kernel(limit, verts_2d):
+        vert_count = verts_2d.shape[0]
+        # Every edge adds at most two verts
+        clipped = numpy.empty((2 * vert_count, 3))
+        clipped_count = 0
+        for i in range(vert_count):
+            j = i + 1 if i + 1 < vert_count else 0
+            if is_max:
+                curr_inside = verts_2d[i, axis] <= limit
+                next_inside = verts_2d[j, axis] <= limit
+            else:
+                curr_inside = verts_2d[i, axis] >= limit
+                next_inside = verts_2d[j, axis] >= limit
+
+            # in -> out and out -> in edges add the intersection
+            if curr_inside != next_inside:
+                t = (limit - verts_2d[i, axis]) / (verts_2d[j, axis] - verts_2d[i, axis])
+                for k in range(3):
+                    clipped[clipped_count, k] = verts_2d[i, k] + t * (verts_2d[j, k] - verts_2d[i, k])
+                clipped[clipped_count, axis] = limit
+                clipped_count += 1
+
+            # Edges ending inside add their end vert
+            if next_inside:
+                for k in range(3):
+                    clipped[clipped_count, k] = verts_2d[j, k]
+                clipped_count += 1
+
+        return clipped[:clipped_count]
+
+    return clip_kernel
+
+@functools.lru_cache(maxsize=None)
+def compile_kernels():
+    """Calls every numeric kernel once so that Numba compiles them at the start of the first 
+    export instead of in the middle of it, later calls return immediately 
+    (does nothing useful without Numba)
+    """
+    intersect_on_axis_kernel(0, 0.5, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+
+    triangle = numpy.array(((0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 2.0, 0.0)))
+    perspective_project_kernel(triangle, numpy.identity(4), 1.0, 1.0)
+    view_coords_kernel(triangle, triangle[:, :2].copy(), numpy.zeros(3), numpy.ones(3), 1.0)
+    perimeter_l1_kernel(triangle)
+    relative_pos_kernel(triangle, numpy.zeros(1, dtype=numpy.intp), numpy.ones(3), 0.0,
+                        PLANE_DISTANCE_THRESHOLD)
+    backface_kernel(triangle, triangle, numpy.zeros(3))
+    for axis in (0, 1):
+        for is_max in (False, True):
+            make_clip_kernel(axis, is_max)(1.0, triangle)
+
 #
 # CLIPPING
 #
@@ -2709,9 +3234,7 @@ class ViewPortClipping:
         :return: True if inside, False otherwise
         :rtype: bool
         """
-        if pos_x < x0 or pos_x > x1 or pos_y < y0 or pos_y > y1:
-            return False
-        return True
+        return (pos_x >= x0) & (pos_x <= x1) & (pos_y >= y0) & (pos_y <= y1)
 
     @staticmethod
     def intersect_on_x(x_val, vert0, vert1):
@@ -2726,11 +3249,8 @@ class ViewPortClipping:
         :return: Vert - intersection of both lines
         :rtype: float[3]
         """
-        k_y = (vert1[1] - vert0[1]) / (vert1[0] - vert0[0])
-        k_depth = (vert1[2] - vert0[2]) / (vert1[0] - vert0[0])
-        return (x_val,
-                vert0[1] + (x_val - vert0[0]) * k_y,
-                vert0[2] + (x_val - vert0[0]) * k_depth)
+        return intersect_on_axis_kernel(0, x_val, vert0[0], vert0[1], vert0[2],
+                                        vert1[0], vert1[1], vert1[2])
 
     @staticmethod
     def intersect_on_y(y_val, vert0, vert1):
@@ -2745,11 +3265,8 @@ class ViewPortClipping:
         :return: Vert - intersection of both lines
         :rtype: float[3]
         """
-        k_x = (vert1[0] - vert0[0]) / (vert1[1] - vert0[1])
-        k_depth = (vert1[2] - vert0[2]) / (vert1[1] - vert0[1])
-        return (vert0[0] + (y_val - vert0[1]) * k_x,
-                y_val,
-                vert0[2] + (y_val - vert0[1]) * k_depth)
+        return intersect_on_axis_kernel(1, y_val, vert0[0], vert0[1], vert0[2],
+                                        vert1[0], vert1[1], vert1[2])
 
     @staticmethod
     def intersect_on_z(z_val, vert0, vert1):
@@ -2764,11 +3281,49 @@ class ViewPortClipping:
         :return: Vert - intersection of both lines
         :rtype: float[3]
         """
-        k_x = (vert1[0] - vert0[0]) / (vert1[2] - vert0[2])
-        k_y = (vert1[1] - vert0[1]) / (vert1[2] - vert0[2])
-        return (vert0[0] + (z_val - vert0[2]) * k_x,
-                vert0[1] + (z_val - vert0[2]) * k_y,
-                z_val)
+        return intersect_on_axis_kernel(2, z_val, vert0[0], vert0[1], vert0[2],
+                                        vert1[0], vert1[1], vert1[2])
+
+    @staticmethod
+    def clip_to_edge(verts_2d, axis, limit, is_max):
+        """Clips a polygon by a single axis-aligned edge (one Sutherland-Hodgman pass)
+
+        :param verts_2d: Unclipped polygon vertices
+        :type verts_2d: numpy.ndarray of shape (n, 3)
+        :param axis: Index of the clipped coordinate (0 for x, 1 for y, 2 for z)
+        :type axis: int
+        :param limit: Position of the clipping edge on the axis
+        :type limit: float
+        :param is_max: True if limit is the maximum allowed value, False if minimum
+        :type is_max: bool
+        :return: Clipped polygon vertices
+        :rtype: numpy.ndarray of shape (m, 3)
+        """
+        if len(verts_2d) == 0:
+            return verts_2d
+
+        # Every edge goes from a vert to the next one (last vert connects to the first),
+        # the next verts are built once by slicing and the flags of both ends are derived 
+        # from the same comparison
+        next_verts = numpy.concatenate((verts_2d[1:], verts_2d[:1]))
+        if is_max:
+            inside = verts_2d[:, axis] <= limit
+        else:
+            inside = verts_2d[:, axis] >= limit
+        next_inside = numpy.concatenate((inside[1:], inside[:1]))
+
+        # Intersections of all edges at once, only the ones crossing the limit are used
+        # (edges lying on the limit give infinite or NaN t, which is multiplied by zero)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t = (limit - verts_2d[:, axis]) / (next_verts[:, axis] - verts_2d[:, axis])
+            intersections = verts_2d + t[:, None] * (next_verts - verts_2d)
+        intersections[:, axis] = limit
+
+        # Each edge emits [intersection, next vert] filtered by the Sutherland-Hodgman rules
+        # in -> in: next vert, out -> in: intersection and next vert, in -> out: intersection
+        candidates = numpy.stack((intersections, next_verts), axis=1)
+        mask = numpy.stack((inside != next_inside, next_inside), axis=1)
+        return candidates[mask]
 
     @staticmethod
     def clip_to_boundary(min_x, min_y, max_x, max_y, verts_2d):
@@ -2783,75 +3338,37 @@ class ViewPortClipping:
         :param max_y: Maximum y position value
         :type max_y: float
         :param verts_2d: Unclipped polygon vertices of the viewport polygon
-        :type verts_2d: list of float[3]
+        :type verts_2d: numpy.ndarray of shape (n, 3) or list of float[3]
         :return: Clipped polygon vertices of the viewport polygon or None
-        :rtype: list of float[3] or None
-        """
-        clipped_verts_2d = []
-
-        # Clips using min_x
-        for index, vert in enumerate(verts_2d):
-            next_vert = verts_2d[(index + 1) % len(verts_2d)]
-            x0 = vert[0]
-            x1 = next_vert[0]
-            if x0 >= min_x and x1 >= min_x:
-                clipped_verts_2d.append(next_vert)
-            elif x0 < min_x and x1 >= min_x:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_x(min_x, vert, next_vert))
-                clipped_verts_2d.append(next_vert)
-            elif x0 >= min_x and x1 < min_x:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_x(min_x, vert, next_vert))
-        verts_2d = clipped_verts_2d
-        clipped_verts_2d = []
-
-        # Clips using min_y
-        for index, vert in enumerate(verts_2d):
-            next_vert = verts_2d[(index + 1) % len(verts_2d)]
-            y0 = vert[1]
-            y1 = next_vert[1]
-            if y0 >= min_y and y1 >= min_y:
-                clipped_verts_2d.append(next_vert)
-            elif y0 < min_y and y1 >= min_y:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_y(min_y, vert, next_vert))
-                clipped_verts_2d.append(next_vert)
-            elif y0 >= min_y and y1 < min_y:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_y(min_y, vert, next_vert))
-        verts_2d = clipped_verts_2d
-        clipped_verts_2d = []
-
-        # Clips using max_x
-        for index, vert in enumerate(verts_2d):
-            next_vert = verts_2d[(index + 1) % len(verts_2d)]
-            x0 = vert[0]
-            x1 = next_vert[0]
-            if x0 <= max_x and x1 <= max_x:
-                clipped_verts_2d.append(next_vert)
-            elif x0 > max_x and x1 <= max_x:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_x(max_x, vert, next_vert))
-                clipped_verts_2d.append(next_vert)
-            elif x0 <= max_x and x1 > max_x:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_x(max_x, vert, next_vert))
-        verts_2d = clipped_verts_2d
-        clipped_verts_2d = []
-
-        # Clips using max_y
-        for index, vert in enumerate(verts_2d):
-            next_vert = verts_2d[(index + 1) % len(verts_2d)]
-            y0 = vert[1]
-            y1 = next_vert[1]
-            if y0 <= max_y and y1 <= max_y:
-                clipped_verts_2d.append(next_vert)
-            elif y0 > max_y and y1 <= max_y:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_y(max_y, vert, next_vert))
-                clipped_verts_2d.append(next_vert)
-            elif y0 <= max_y and y1 > max_y:
-                clipped_verts_2d.append(ViewPortClipping.intersect_on_y(max_y, vert, next_vert))
+        :rtype: numpy.ndarray of shape (m, 3) or None
+        """
+        verts_2d = numpy.asarray(verts_2d, dtype=numpy.float64).reshape(-1, 3)
+        if len(verts_2d) < 3:
+            return None
+
+        # Polygons entirely outside any edge have no verts inside the boundary
+        bounds_min = verts_2d.min(axis=0)
+        bounds_max = verts_2d.max(axis=0)
+        if bounds_max[0] < min_x or bounds_max[1] < min_y or \
+           bounds_min[0] > max_x or bounds_min[1] > max_y:
+            return None
+
+        # Clips using min_x, min_y, max_x and max_y, passes are run only for the edges 
+        # the polygon crosses (clipping never extends the range of the other axis)
+        if bounds_min[0] < min_x:
+            verts_2d = make_clip_kernel(0, False)(min_x, verts_2d)
+        if bounds_min[1] < min_y:
+            verts_2d = make_clip_kernel(1, False)(min_y, verts_2d)
+        if bounds_max[0] > max_x:
+            verts_2d = make_clip_kernel(0, True)(max_x, verts_2d)
+        if bounds_max[1] > max_y:
+            verts_2d = make_clip_kernel(1, True)(max_y, verts_2d)
 
         # Returns None if no verts inside
-        if len(clipped_verts_2d) < 3:
+        if len(verts_2d) < 3:
             return None
 
-        return clipped_verts_2d
+        return verts_2d
 
     @staticmethod
     def clip_2d_polygon(verts_2d, camera_info):
@@ -2859,20 +3376,24 @@ class ViewPortClipping:
            returns None if outside viewport, returns clipped polygon if both
 
         :param verts_2d: Unclipped viewport polygon
-        :type verts_2d: List of float[3]
+        :type verts_2d: numpy.ndarray of shape (n, 3) or List of float[3]
         :param camera_info: Information about the camera used to generate this body
         :type camera_info: CameraInfo
         :return: Viewport polygon with all vertices inside the screen boundary or None
-        :rtype: List of float[3] or None
+        :rtype: numpy.ndarray of shape (m, 3) or None
         """
+        verts_2d = numpy.asarray(verts_2d, dtype=numpy.float64).reshape(-1, 3)
         res_x = camera_info.view_width
         res_y = camera_info.view_height
 
-        # Checks visibility of 2d vertices
-        all_visible = True
-        for vert in verts_2d:
-            if not ViewPortClipping.is_inside(0, 0, res_x, res_y, vert[0], vert[1]):
-                all_visible = False
+        # Checks visibility of all 2d vertices by their bounding box, 
+        # the test stops at the first side that is crossed (no boolean arrays are created)
+        if len(verts_2d) == 0:
+            return None
+        xs = verts_2d[:, 0]
+        ys = verts_2d[:, 1]
+        all_visible = xs.min() >= 0 and xs.max() <= res_x and \
+                      ys.min() >= 0 and ys.max() <= res_y
 
         # Returns verts if all are visible, otherwise clips
         if all_visible:
@@ -2881,6 +3402,29 @@ class ViewPortClipping:
             # Clips polygon to viewport boundary
             return ViewPortClipping.clip_to_boundary(0, 0, res_x, res_y, verts_2d)
 
+    @staticmethod
+    def cull_outside_view(view_polygons, camera_info):
+        """Removes polygons whose bounding boxes are entirely outside the viewport,
+        polygons with animated materials are kept since animations can move them into view
+
+        :param view_polygons: Polygons to cull (bounds have to be set)
+        :type view_polygons: List of ViewPolygon
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: Polygons that can be visible in the viewport
+        :rtype: List of ViewPolygon
+        """
+        if len(view_polygons) == 0:
+            return view_polygons
+
+        bounds = numpy.vstack([polygon.bounds for polygon in view_polygons])
+        visible = (bounds[:, 1] >= 0) & (bounds[:, 0] <= camera_info.view_width) & \
+                  (bounds[:, 3] >= 0) & (bounds[:, 2] <= camera_info.view_height)
+        animated_class_names = camera_info.animated_class_names
+
+        return [polygon for polygon, is_visible in zip(view_polygons, visible)
+                if is_visible or polygon.material_name in animated_class_names]
+
     @staticmethod
     def clip_to_front(face, camera_pos, camera_dir):
         """Creates ViewPolygon instances representing the face and camera plane,
@@ -2896,16 +3440,15 @@ class ViewPortClipping:
         :rtype: ViewPolygon or None
         """
         # Constructs ViewPolygon instances representing the face and the camera plane
-        verts = []
-        for vert in face.verts:
-            verts.append(vert.co)
-        face_polygon = ViewPolygon(verts, 0, None, 0)
+        # (vertex coordinates are read in one pass, BMesh sequences have no foreach_get)
+        verts = numpy.array([vert.co for vert in face.verts], dtype=numpy.float64)
+        face_polygon = ViewPolygon(verts, 0, None, 0, set_normal=False)
 
-        # Other camera plane verts can be anything as long as the first one is correct
-        # DepthSorter cutting function only checks the first vert and normal of the plane polygon
-        camera_plane_verts = (camera_pos, (0, 0, 0), (1, 1, 1))
-        camera_plane = ViewPolygon(camera_plane_verts, 0, None, 0)
-        camera_plane.normal = camera_dir
+        # DepthSorter cutting function only uses the plane of the plane polygon 
+        # (see ViewPolygon.get_plane()), which is set directly from the camera
+        camera_plane = ViewPolygon((camera_pos,), 0, None, 0, normal=camera_dir)
+        camera_normal = camera_plane.normal / numpy.linalg.norm(camera_plane.normal)
+        camera_plane.plane = (camera_normal, -float(camera_normal @ camera_plane.verts[0]))
 
         # First fragment is the front one
         fragments = DepthSorter.cut_conflicting(camera_plane, face_polygon)
@@ -2994,6 +3537,9 @@ class ObjectConverter:
               (datetime.now() - STARTTIME).total_seconds())
         STARTTIME = datetime.now()
 
+        # Removes polygons outside of the view before sorting and cutting
+        view_polygons = ViewPortClipping.cull_outside_view(view_polygons, camera_info)
+
         # Resolves conflicts and sorts based on settings
         if not props.cut_conflicts:
             # Sorts the viewport polygons based on their depth attribute
@@ -3002,7 +3548,21 @@ class ObjectConverter:
 
             print("Quickly depth sorted... ", (datetime.now() - STARTTIME).total_seconds())
             STARTTIME = datetime.now()
+        elif not DepthSorter.has_overlapping_boxes(view_polygons):
+            # No two polygons can obscure each other in an order different from their depth,
+            # sorting by the furthest point is exact and nothing has to be cut
+            DepthSorter.reorder_by_keys(view_polygons,
+                                        numpy.vstack([polygon.bounds
+                                                      for polygon in view_polygons])[:, 5],
+                                        True)
+
+            print("No overlapping polygons, depth sorted without cutting... ", 
+                  (datetime.now() - STARTTIME).total_seconds())
+            STARTTIME = datetime.now()
         else:
+            # Calculates normals of all polygons (skipped during conversion)
+            ViewPolygon.calculate_normals(view_polygons)
+
             # Corrects normals of polygons so that all face the camera
             DepthSorter.correct_normals(view_polygons, (view_width / 2.0,
                                                         view_height / 2.0,
@@ -3049,7 +3609,7 @@ class ObjectConverter:
                     
         # Depth sorts based on selected option
         sort_option = EnumPropertyDictionaries.global_sorting[props.global_sorting_option]
-        view_curves.sort(key = lambda element: element.get_depth(sort_option), reverse = True)
+        DepthSorter.depth_sort_view_types(view_curves, sort_option)
 
         return view_curves
 
@@ -3081,7 +3641,7 @@ class ObjectConverter:
 
         # Depth sorts based on selected option
         sort_option = EnumPropertyDictionaries.global_sorting[props.global_sorting_option]
-        view_texts.sort(key = lambda element: element.get_depth(sort_option), reverse = True)
+        DepthSorter.depth_sort_view_types(view_texts, sort_option)
         
         return view_texts
         
@@ -3106,7 +3666,7 @@ class ObjectConverter:
                     
         # Depth sorts based on selected option
         sort_option = EnumPropertyDictionaries.global_sorting[props.global_sorting_option]
-        view_gpencils.sort(key = lambda element: element.get_depth(sort_option), reverse = True)
+        DepthSorter.depth_sort_view_types(view_gpencils, sort_option)
 
         return view_gpencils
     
@@ -3134,11 +3694,43 @@ class ObjectConverter:
 
         # Depth sorts based on selected option
         sort_option = EnumPropertyDictionaries.global_sorting[props.global_sorting_option]
-        images.sort(key = lambda element: element.get_depth(sort_option), reverse = True)
+        DepthSorter.depth_sort_view_types(images, sort_option)
 
         return images
     """
 
+class PolygonSettings:
+    """Class storing the export properties used for every mesh face, 
+    reading them once avoids repeated property lookups through bpy in the per-face code
+    """
+
+    __slots__ = ("point_light", "light_color", "ambient_color", "light_dir_normalized", 
+                 "disable_lighting", "stroke_same_as_fill", "fill_color", "override",
+                 "coord_precision")
+
+    def __init__(self, props, camera_info):
+        """Constructor of the PolygonSettings type
+
+        :param props: Export properties
+        :type props: bpy.context.scene.export_properties
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        """
+        self.point_light = EnumPropertyDictionaries.light_source[props.light_type] == 0
+        self.light_color = tuple(props.light_color)
+        self.ambient_color = tuple(props.ambient_color)
+        # Direction of planar light is the same for all faces, it is normalized once
+        # (zero vector if the direction has no length, every face is then unlit)
+        light_dir = numpy.asarray(camera_info.light_dir, dtype=numpy.float64)
+        light_dir_length = numpy.sqrt(light_dir @ light_dir)
+        self.light_dir_normalized = light_dir / light_dir_length if light_dir_length != 0.0 \
+                                    else numpy.zeros(3, dtype=numpy.float64)
+        self.disable_lighting = props.polygon_disable_lighting
+        self.stroke_same_as_fill = props.polygon_stroke_same_as_fill
+        self.fill_color = tuple(props.polygon_fill_color)
+        self.override = props.polygon_override
+        self.coord_precision = props.coord_precision
+
 class MeshConverter:
     """Class containing methods for converting meshes into a series of ViewPolygon instances
     """
@@ -3162,36 +3754,174 @@ class MeshConverter:
         return False
 
     @staticmethod
-    def get_face_color(props, face, face_normal, base_color, camera_info):
-        """Calculates color of the face based on options and parameters
+    def get_backfaces(first_verts, face_normals, camera_pos):
+        """Checks which faces are backfaces, all faces are checked at once
 
-        :param props: Export properties
-        :type props: bpy.context.scene.export_properties
-        :param face: Face of the mesh
-        :type face: BMFace
-        :param face_normal: Normal of the face in world coordinates (NOT LOCAL COORDINATES)
-        :type face_normal: float[3]
-        :param face_material: Base color of the material
-        :type face_material: float[4]
+        :param first_verts: First vertex of every face in world coordinates
+        :type first_verts: numpy.ndarray of shape (n, 3)
+        :param face_normals: Normal of every face in world coordinates (NOT LOCAL COORDINATES)
+        :type face_normals: numpy.ndarray of shape (n, 3)
+        :param camera_pos: Position of the camera in world coordinates
+        :type camera_pos: float[3]
+        :return: Array with True for every backface, False otherwise
+        :rtype: numpy.ndarray of bool
+        """
+        camera_pos = numpy.asarray(camera_pos, dtype=numpy.float64)
+        if NUMBA_AVAILABLE:
+            return backface_kernel(first_verts, face_normals, camera_pos)
+
+        # Same test as is_backface() with one dot product per row
+        camera_to_face = first_verts - camera_pos
+        return numpy.einsum("ij,ij->i", camera_to_face, face_normals) >= 0
+
+    @staticmethod
+    def read_mesh_arrays(mesh, matrix_world):
+        """Reads vertex positions, face normals and the loops (face corners) of a mesh 
+        with foreach_get (one copy per attribute instead of walking the mesh in Python)
+
+        :param mesh: Mesh to read, vertices and faces are in the same order as in 
+        a bmesh created from it
+        :type mesh: bpy.types.Mesh
+        :param matrix_world: Matrix transforming the vertices to world coordinates
+        :type matrix_world: Matrix
+        :return: Vertex positions in world coordinates, 
+        face normals in LOCAL coordinates, index of the first loop of every face, 
+        number of loops of every face, vertex index of every loop
+        :rtype: (numpy.ndarray of shape (n, 3), numpy.ndarray of shape (m, 3), 
+        numpy.ndarray of shape (m,), numpy.ndarray of shape (m,), numpy.ndarray of shape (l,))
+        """
+        # Mesh stores floats in single precision, the transformation is done in double
+        coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+        mesh.vertices.foreach_get("co", coords)
+        matrix = numpy.array(matrix_world, dtype=numpy.float64)
+        coords = coords.reshape(-1, 3).astype(numpy.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+
+        face_normals = numpy.empty(len(mesh.polygons) * 3, dtype=numpy.float32)
+        mesh.polygons.foreach_get("normal", face_normals)
+
+        loop_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_verts = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        return (coords, face_normals.reshape(-1, 3).astype(numpy.float64),
+                loop_starts, loop_totals, loop_verts)
+
+    @staticmethod
+    def project_verts(coords, camera_info):
+        """Converts all vertices of a mesh to viewport positions and depths at once
+
+        :param coords: Vertex positions in world coordinates
+        :type coords: numpy.ndarray of shape (n, 3)
         :param camera_info: Information about the camera used to generate this body
         :type camera_info: CameraInfo
-        :return: Final color as (r, g, b, opacity), rgb as (0-255), opacity as (0.0-1.0)
-        :rtype: float[4]
+        :return: Array indexed by vertex index with rows (x, y, depth), 
+        x and y are NaN for vertices behind the camera, None if batch conversion is unavailable
+        :rtype: numpy.ndarray of shape (n, 3) or None
         """
-        # Gets the angle between direction to the light and face normal
-        dir_vec = camera_info.light_dir
-        if EnumPropertyDictionaries.light_source[props.light_type] == 0:
-            dir_vec = camera_info.light_pos - face.verts[0].co
+        if camera_info.world_to_viewport_batch is None:
+            return None
 
-        cosine = ((dir_vec @ face_normal) /
-                  (numpy.linalg.norm(dir_vec)) * numpy.linalg.norm(face_normal))
+        vert_locs = camera_info.world_to_viewport_batch(coords)
 
-        
+        # Same as distance_point_to_plane(vert.co, camera_pos, camera_dir) for every vertex
+        camera_dir = numpy.asarray(camera_info.camera_dir_normalized, dtype=numpy.float64)
+        camera_pos = numpy.asarray(camera_info.camera_pos, dtype=numpy.float64)
+        if NUMBA_AVAILABLE:
+            return view_coords_kernel(coords, vert_locs, camera_pos, camera_dir,
+                                      float(camera_info.view_height))
+        depths = (coords - camera_pos) @ camera_dir
+
+        return numpy.stack((vert_locs[:, 0],
+                            camera_info.view_height - vert_locs[:, 1],
+                            depths), axis=1)
+
+    @staticmethod
+    def project_front_verts(verts, camera_info):
+        """Converts vertices of a polygon clipped to the front of the camera 
+        to viewport positions and depths, vertices that are still behind the camera are left out
+
+        :param verts: Vertex positions in world coordinates
+        :type verts: numpy.ndarray of shape (n, 3)
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: Rows (x, y, depth) of the vertices in front of the camera
+        :rtype: numpy.ndarray of shape (m, 3) or List of float[3]
+        """
+        # Projects the whole array at once, rows behind the camera have NaN x
+        verts_2d = MeshConverter.project_verts(verts, camera_info)
+        if verts_2d is not None:
+            return verts_2d[~numpy.isnan(verts_2d[:, 0])]
+
+        camera_pos = camera_info.camera_pos
+        camera_dir_n = camera_info.camera_dir_normalized
+        view_height = camera_info.view_height
+        world_to_viewport = camera_info.world_to_viewport
+
+        verts_2d = []
+        for vert in verts:
+            vert_co = Vector(vert)
+            vert_loc = world_to_viewport(vert_co)
+            # If vertex is behind the camera, ignores it
+            if vert_loc is None:
+                continue
+
+            vert_depth = (vert_co - camera_pos) @ camera_dir_n
+
+            verts_2d.append((vert_loc[0],
+                             view_height - vert_loc[1],
+                             vert_depth))
+        return verts_2d
+
+    @staticmethod
+    def get_face_brightness(settings, first_verts, face_normals, camera_info):
+        """Calculates the Lambert brightness of all faces of a mesh at once
+
+        :param settings: Export properties read once for all faces
+        :type settings: PolygonSettings
+        :param first_verts: First vertex of every face in world coordinates
+        :type first_verts: numpy.ndarray of shape (n, 3)
+        :param face_normals: Unit normal (or zero vector) of every face in world coordinates 
+        (NOT LOCAL COORDINATES)
+        :type face_normals: numpy.ndarray of shape (n, 3)
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: Cosine of the angle between the direction to the light and the normal 
+        (0 if negative) for every face
+        :rtype: numpy.ndarray of shape (n,)
+        """
+        # Gets the angle between direction to the light and face normal,
+        # normals are already unit length so only the light direction is divided by its length
+        # (zero normals give zero dot products, the faces stay unlit)
+        if settings.point_light:
+            dir_vecs = numpy.asarray(camera_info.light_pos, dtype=numpy.float64) - first_verts
+            dir_lengths = numpy.sqrt(numpy.einsum("ij,ij->i", dir_vecs, dir_vecs))
+            cosines = numpy.zeros(len(face_normals), dtype=numpy.float64)
+            numpy.divide(numpy.einsum("ij,ij->i", dir_vecs, face_normals), dir_lengths, 
+                         out=cosines, where=dir_lengths != 0.0)
+        else:
+            cosines = face_normals @ settings.light_dir_normalized
+
+        return numpy.maximum(cosines, 0.0)
+
+    @staticmethod
+    def get_face_color(settings, brightness, base_color):
+        """Calculates color of the face based on options and parameters
 
-        light_color = props.light_color
-        light_ambient = props.ambient_color
+        :param settings: Export properties read once for all faces
+        :type settings: PolygonSettings
+        :param brightness: Lambert brightness of the face (see get_face_brightness())
+        :type brightness: float
+        :param base_color: Base color of the material
+        :type base_color: float[4]
+        :return: Final color as (r, g, b, opacity), rgb as (0-255), opacity as (0.0-1.0)
+        :rtype: float[4]
+        """
+        light_color = settings.light_color
+        light_ambient = settings.ambient_color
 
-        brightness = max(cosine, 0)
         diff_color = base_color
         return  (diff_color[0] * light_ambient[0] + diff_color[0] * brightness * light_color[0],
                 diff_color[1] * light_ambient[1] + diff_color[1] * brightness * light_color[1],
@@ -3199,7 +3929,7 @@ class MeshConverter:
                 diff_color[3])
 
     @staticmethod
-    def mesh_shape_to_view_polygon(props, face, camera_info):
+    def mesh_shape_to_view_polygon(props, face, camera_info, vert_coords_2d = None):
         """Converts a mesh face to the ViewPolygon class with black color and 
         does NOT set bounds by default
         (lightweight compared to full conversion)
@@ -3210,29 +3940,39 @@ class MeshConverter:
         :type face: BMFace
         :param camera_info: Information about the camera used to generate this body
         :type camera_info: CameraInfo
+        :param vert_coords_2d: Viewport positions and depths of all mesh vertices 
+        (from project_verts()), vertices are converted one by one if None, defaults to None
+        :type vert_coords_2d: numpy.ndarray of shape (n, 3) or None
         :return: ViewPolygon instance representing the shape of the face in viewport
         :rtype: ViewPolygon
         """
         camera_pos = camera_info.camera_pos
         camera_dir = camera_info.camera_dir
+        camera_dir_n = camera_info.camera_dir_normalized
         view_height = camera_info.view_height
         world_to_viewport = camera_info.world_to_viewport
 
         # Gets viewport position and depth of all vertices
         verts_2d = []
         behind_flag = False
-        for vert in face.verts:
-            vert_loc = world_to_viewport(vert.co)
-            # If vertex is behind the camera, sets the flag and breaks the cycle
-            if vert_loc is None:
-                behind_flag = True
-                break
+        if vert_coords_2d is not None:
+            # Picks the already projected vertices of the face
+            face_indices = [vert.index for vert in face.verts]
+            verts_2d = vert_coords_2d[face_indices]
+            behind_flag = bool(numpy.isnan(verts_2d[:, 0]).any())
+        else:
+            for vert in face.verts:
+                vert_loc = world_to_viewport(vert.co)
+                # If vertex is behind the camera, sets the flag and breaks the cycle
+                if vert_loc is None:
+                    behind_flag = True
+                    break
 
-            vert_depth = distance_point_to_plane(vert.co, camera_pos, camera_dir)
+                vert_depth = (vert.co - camera_pos) @ camera_dir_n
 
-            verts_2d.append((vert_loc[0],
-                             view_height - vert_loc[1],
-                             vert_depth))
+                verts_2d.append((vert_loc[0],
+                                 view_height - vert_loc[1],
+                                 vert_depth))
 
         # If vertex was behind the camera, clips the polygon to front and repeats the process
         if behind_flag:
@@ -3241,18 +3981,7 @@ class MeshConverter:
             # If no part of the polygon remains in front, face is ignored
             if front_clipped_polygon is None:
                 return None
-            verts_2d.clear()
-            for vert in front_clipped_polygon.verts:
-                vert_loc = world_to_viewport(vert)
-                # If vertex is behind the camera, ignores it
-                if vert_loc is None:
-                    continue
-
-                vert_depth = distance_point_to_plane(vert, camera_pos, camera_dir)
-
-                verts_2d.append((vert_loc[0],
-                                view_height - vert_loc[1],
-                                vert_depth))
+            verts_2d = MeshConverter.project_front_verts(front_clipped_polygon.verts, camera_info)
 
         # Clips the 2D polygon
         verts_2d = ViewPortClipping.clip_2d_polygon(verts_2d, camera_info)
@@ -3260,51 +3989,121 @@ class MeshConverter:
             # All vertices are outside the view
             return None
 
-        depth = distance_point_to_plane(face.calc_center_median(), camera_pos, camera_dir)
+        if vert_coords_2d is not None:
+            # Depth of the median center is the mean of the vertex depths
+            depth = float(vert_coords_2d[face_indices, 2].mean())
+        else:
+            depth = (face.calc_center_median() - camera_pos) @ camera_dir_n
 
         return ViewPolygon(verts_2d,
                             depth,
                             (0, 0, 0),
-                            1.0, set_bounds=False)
+                            1.0, set_bounds=False, set_normal=False)
+
+    @staticmethod
+    def get_global_material(settings):
+        """Returns settings of the global material used by faces without a material
+
+        :param settings: Export properties read once for all faces
+        :type settings: PolygonSettings
+        :return: (material_name, ignored_lighting, stroke_equals_fill, base_color)
+        :rtype: (str, bool, bool, float[4])
+        """
+        return ("export_svg_global_model_material", settings.disable_lighting, 
+                settings.stroke_same_as_fill, settings.fill_color)
+
+    @staticmethod
+    def read_face_materials(settings, obj, camera_info):
+        """Reads the export settings of every material slot of the object once, 
+        faces then pick them by their material index instead of accessing the material properties
+
+        :param settings: Export properties read once for all faces
+        :type settings: PolygonSettings
+        :param obj: Object whose material slots are read
+        :type obj: bpy.types.Object
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: (material_name, ignored_lighting, stroke_equals_fill, base_color) 
+        for every material slot, empty if the materials are not used (every face uses 
+        the global material)
+        :rtype: List of (str, bool, bool, float[4])
+        """
+        if settings.override:
+            return []
+
+        face_materials = []
+        for material_slot in obj.material_slots:
+            face_material = material_slot.material
+            # Empty slots use the global settings
+            if face_material is None:
+                face_materials.append(MeshConverter.get_global_material(settings))
+                continue
+            material_props = face_material.export_svg_properties
+            face_materials.append(("polygon_" + camera_info.mat_rename_dict[face_material.name],
+                                   material_props.ignore_lighting,
+                                   material_props.stroke_equals_fill,
+                                   tuple(material_props.fill_color)))
+        return face_materials
 
     @staticmethod
-    def mesh_face_to_view_polygon(props, obj, face, face_normal, camera_info):
+    def mesh_face_to_view_polygon(settings, obj, face, face_normal, camera_info,
+                                  face_verts_2d = None, face_points = None,
+                                  face_brightness = None, face_materials = None):
         """Converts a mesh face to the ViewPolygon class
 
-        :param props: Export properties
-        :type props: bpy.context.scene.export_properties
+        :param settings: Export properties read once for all faces
+        :type settings: PolygonSettings
         :param obj: Object the face belongs to (required because it stores the face materials)
         :type obj: bpy.types.Object
         :param face: Face to convert
         :type face: BMFace
         :param face_normal: Normal of the face in world coordinates (NOT LOCAL COORDINATES)
-        :type face_normal: float[3]
+        :type face_normal: Vector
         :param camera_info: Information about the camera used to generate this body
         :type camera_info: CameraInfo
+        :param face_verts_2d: Viewport positions and depths of the face vertices 
+        (rows of the already projected face corners of the mesh), 
+        vertices are converted one by one if None, defaults to None
+        :type face_verts_2d: numpy.ndarray of shape (n, 3) or None
+        :param face_points: Svg points of the face formatted from face_verts_2d, 
+        points are formatted from the polygon verts if None, defaults to None
+        :type face_points: str or None
+        :param face_brightness: Lambert brightness of the face (from get_face_brightness()),
+        calculated for the single face if None, defaults to None
+        :type face_brightness: float or None
+        :param face_materials: Material settings of the object (from read_face_materials()), 
+        read for the single face if None, defaults to None
+        :type face_materials: List of (str, bool, bool, float[4]) or None
         :raises ValueError: Raised when atleast one vertex of the face is behind the camera
         :return: ViewPolygon instance representing the face in viewport
         :rtype: ViewPolygon
         """
         camera_pos = camera_info.camera_pos
         camera_dir = camera_info.camera_dir
+        camera_dir_n = camera_info.camera_dir_normalized
         view_height = camera_info.view_height
         world_to_viewport = camera_info.world_to_viewport
 
         # Gets viewport position and depth of all vertices
         verts_2d = []
         behind_flag = False
-        for vert in face.verts:
-            vert_loc = world_to_viewport(vert.co)
-            # If vertex is behind the camera, sets the flag and breaks the cycle
-            if vert_loc is None:
-                behind_flag = True
-                break
+        if face_verts_2d is not None:
+            # Uses the already projected vertices of the face
+            verts_2d = face_verts_2d
+            behind_flag = bool(numpy.isnan(verts_2d[:, 0]).any())
+        else:
+            for vert in face.verts:
+                vert_loc = world_to_viewport(vert.co)
+                # If vertex is behind the camera, sets the flag and breaks the cycle
+                if vert_loc is None:
+                    behind_flag = True
+                    break
 
-            vert_depth = distance_point_to_plane(vert.co, camera_pos, camera_dir)
+                vert_depth = (vert.co - camera_pos) @ camera_dir_n
 
-            verts_2d.append((vert_loc[0],
-                             view_height - vert_loc[1],
-                             vert_depth))
+                verts_2d.append((vert_loc[0],
+                                 view_height - vert_loc[1],
+                                 vert_depth))
 
         # If vertex was behind the camera, clips the polygon to front and repeats the process
         if behind_flag:
@@ -3313,20 +4112,7 @@ class MeshConverter:
             # If no part of the polygon remains in front, face is ignored
             if front_clipped_polygon is None:
                 return None
-            verts_2d.clear()
-            for vert in front_clipped_polygon.verts:
-                # Converts to Vector first because somewhere in DepthSorter 
-                # it got converted to tuple?
-                vert_loc = world_to_viewport(Vector(vert))
-                # If vertex is behind the camera, ignores it
-                if vert_loc is None:
-                    continue
-
-                vert_depth = distance_point_to_plane(vert, camera_pos, camera_dir)
-
-                verts_2d.append((vert_loc[0],
-                                view_height - vert_loc[1],
-                                vert_depth))
+            verts_2d = MeshConverter.project_front_verts(front_clipped_polygon.verts, camera_info)
 
         # Clips the 2D polygon - currently unused, polygons are not clipped by the plugin anymore
         """verts_2d = ViewPortClipping.clip_2d_polygon(verts_2d, camera_info)
@@ -3335,33 +4121,42 @@ class MeshConverter:
             return None"""
 
         # Gets material of this face or uses global settings
-        face_material = None
-        material_name = "export_svg_global_model_material"
-        ignored_lighting = props.polygon_disable_lighting
-        stroke_equals_fill = props.polygon_stroke_same_as_fill
-        base_color = props.polygon_fill_color
-        if (not props.polygon_override) and (len(obj.material_slots) != 0) and \
-           (obj.material_slots[face.material_index].material is not None):
-            face_material = obj.material_slots[face.material_index].material
-            material_name = "polygon_" + camera_info.mat_rename_dict[face_material.name]
-            ignored_lighting = face_material.export_svg_properties.ignore_lighting
-            stroke_equals_fill = face_material.export_svg_properties.stroke_equals_fill
-            base_color = face_material.export_svg_properties.fill_color
+        if face_materials is None:
+            face_materials = MeshConverter.read_face_materials(settings, obj, camera_info)
+        if len(face_materials) != 0:
+            material_name, ignored_lighting, stroke_equals_fill, base_color = \
+                face_materials[face.material_index]
+        else:
+            material_name, ignored_lighting, stroke_equals_fill, base_color = \
+                MeshConverter.get_global_material(settings)
 
         face_color = [0, 0, 0, 0.0]
         if not ignored_lighting:
             # Calculates color of the face
-            face_color = MeshConverter.get_face_color(props,
-                                                      face, face_normal, base_color,
-                                                      camera_info)
+            if face_brightness is None:
+                face_brightness = float(MeshConverter.get_face_brightness(
+                    settings, numpy.array((face.verts[0].co,)), numpy.array((face_normal.normalized(),)),
+                    camera_info)[0])
+            face_color = MeshConverter.get_face_color(settings, face_brightness, base_color)
+
+        if face_verts_2d is not None:
+            # Depth of the median center is the mean of the vertex depths
+            depth = float(face_verts_2d[:, 2].mean())
+        else:
+            depth = (face.calc_center_median() - camera_pos) @ camera_dir_n
+
+        view_polygon = ViewPolygon(verts_2d, depth, 
+                                   (face_color[0], face_color[1], face_color[2]), face_color[3], 
+                                   set_bounds=False, material_name=material_name, 
+                                   ignored_lighting=ignored_lighting, 
+                                   stroke_equals_fill=stroke_equals_fill, set_normal=False)
 
-        depth = distance_point_to_plane(face.calc_center_median(), camera_pos, camera_dir)
+        # Uses the points joined from the preformatted vertices, 
+        # faces clipped to front have new verts and are formatted later
+        if face_points is not None and not behind_flag:
+            view_polygon.points = face_points
 
-        return ViewPolygon(verts_2d, depth, 
-                           (face_color[0], face_color[1], face_color[2]), face_color[3], 
-                           set_bounds=True, material_name=material_name, 
-                           ignored_lighting=ignored_lighting, 
-                           stroke_equals_fill=stroke_equals_fill)
+        return view_polygon
 
     @staticmethod
     def mesh_to_view_polygons(props, obj, camera_info, view_polygons):
@@ -3392,21 +4187,90 @@ class MeshConverter:
 
         # Transforms the mesh to world coordinates using the object's world matrix
         obj_mesh.transform(obj.matrix_world)
-        # Saves every face of the object as a viewpolygon to the view array
-        for face in obj_mesh.faces:
-            # Transforms the normal of the face from local to world coordinates
-            face_normal_world = (matrix_inv_transp @ face.normal).normalized()
-            if props.backface_culling and \
-                MeshConverter.is_backface(face, face_normal_world, camera_pos):
-                # Culls backfaces
-                continue
-
-            view_polygon = MeshConverter.mesh_face_to_view_polygon(props, obj,
-                                                                   face, face_normal_world,
-                                                                   camera_info)
+        faces = obj_mesh.faces
+
+        # Reads the mesh arrays in bulk, bmesh is only used for per-face data
+        vert_coords, face_normals, loop_starts, loop_totals, loop_verts = \
+            MeshConverter.read_mesh_arrays(obj.data, obj.matrix_world)
+
+        # Converts all vertices to viewport at once, faces then only pick their rows
+        vert_coords_2d = MeshConverter.project_verts(vert_coords, camera_info)
+
+        # Transforms the normals of all faces from local to world coordinates
+        face_normals_world = face_normals @ numpy.array(matrix_inv_transp).T
+        normal_lengths = numpy.linalg.norm(face_normals_world, axis=1, keepdims=True)
+        face_normals_world /= numpy.where(normal_lengths == 0.0, 1.0, normal_lengths)
+
+        # Finds backfaces of the whole mesh in one pass
+        first_verts = vert_coords[loop_verts[loop_starts]]
+        backfaces = numpy.zeros(len(faces), dtype=bool)
+        if props.backface_culling:
+            backfaces = MeshConverter.get_backfaces(first_verts, face_normals_world, camera_pos)
+
+        # Reads properties used by every face only once
+        settings = PolygonSettings(props, camera_info)
+
+        # Reads the material settings of the object once for all faces
+        face_materials = MeshConverter.read_face_materials(settings, obj, camera_info)
+
+        # Lights all faces at once, faces only combine it with the colour of their material
+        face_brightness = MeshConverter.get_face_brightness(settings, first_verts,
+                                                            face_normals_world,
+                                                            camera_info).tolist()
+
+        # Gathers the projected vertices of all face corners into one array, the verts 
+        # of every polygon are a view of its rows instead of a separate array per face
+        # (polygon verts are never modified in place, cutting always creates new arrays),
+        # svg points of all vertices are formatted once, every vertex is shared by several faces
+        corner_coords_2d = None
+        corner_points = None
+        if vert_coords_2d is not None:
+            corner_coords_2d = vert_coords_2d[loop_verts]
+            if backfaces.any():
+                # Only vertices of the faces that are not culled are formatted,
+                # faces own consecutive loops so face flags are repeated over their loops 
+                # in the order of the loops
+                loop_order = numpy.argsort(loop_starts, kind="stable")
+                front_loops = numpy.repeat(~backfaces[loop_order], loop_totals[loop_order])
+                front_verts = numpy.unique(loop_verts[front_loops])
+                vertex_points = [""] * len(vert_coords_2d)
+                front_points = ViewPolygon.format_svg_points(vert_coords_2d[front_verts, :2],
+                                                             settings.coord_precision).split(" ")
+                for vert_index, point in zip(front_verts.tolist(), front_points):
+                    vertex_points[vert_index] = point
+            else:
+                vertex_points = ViewPolygon.format_svg_points(vert_coords_2d[:, :2],
+                                                              settings.coord_precision).split(" ")
+            corner_points = [vertex_points[i] for i in loop_verts.tolist()]
+        loop_ends = (loop_starts + loop_totals).tolist()
+        loop_starts = loop_starts.tolist()
+
+        # Saves every face of the object as a viewpolygon to the view array,
+        # only faces that are not culled as backfaces are visited
+        faces.ensure_lookup_table()
+        first_new_index = len(view_polygons)
+        for face_index in numpy.flatnonzero(~backfaces).tolist():
+            face = faces[face_index]
+            face_normal_world = face_normals_world[face_index]
+            face_verts_2d = None
+            face_points = None
+            if corner_coords_2d is not None:
+                loop_start = loop_starts[face_index]
+                loop_end = loop_ends[face_index]
+                face_verts_2d = corner_coords_2d[loop_start:loop_end]
+                face_points = " ".join(corner_points[loop_start:loop_end])
+            view_polygon = MeshConverter.mesh_face_to_view_polygon(settings, obj,
+                                                                   face, Vector(face_normal_world),
+                                                                   camera_info, face_verts_2d,
+                                                                   face_points,
+                                                                   face_brightness[face_index],
+                                                                   face_materials)
             if view_polygon is not None:
                 view_polygons.append(view_polygon)
 
+        # Calculates bounds of all new polygons of this object at once
+        ViewPolygon.calculate_bounds(view_polygons[first_new_index:])
+
         # Frees the copied mesh
         obj_mesh.free()
 
@@ -3414,6 +4278,53 @@ class CurveConverter:
     """Class containing methods for converting curves into a series of ViewCurve instances
     """
 
+    @staticmethod
+    def project_bezier_points(spline, world_matrix, camera_info):
+        """Converts all bezier points of the spline and their handles to viewport at once, 
+        points with the point or any handle behind the camera are skipped
+
+        :param spline: Spline to convert
+        :type spline: bpy.types.Spline
+        :param world_matrix: World matrix used to transform the spline points
+        :type world_matrix: float[4][4]
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: Transformed bezier points (left handle, right handle, point) and depths 
+        of their points, None if batch conversion is unavailable
+        :rtype: (List of ((float, float), (float, float), (float, float)), numpy.ndarray) or None
+        """
+        if camera_info.world_to_viewport_batch is None:
+            return None
+
+        # Reads left handles, right handles and points of the whole spline (single precision)
+        # and transforms them to world coordinates in double precision
+        spline_points = spline.bezier_points
+        point_count = len(spline_points)
+        if point_count == 0:
+            return [], numpy.empty(0, dtype=numpy.float64)
+        local_coords = numpy.empty((3, point_count * 3), dtype=numpy.float32)
+        spline_points.foreach_get("handle_left", local_coords[0])
+        spline_points.foreach_get("handle_right", local_coords[1])
+        spline_points.foreach_get("co", local_coords[2])
+        matrix = numpy.array(world_matrix, dtype=numpy.float64)
+        coords = local_coords.reshape(-1, 3).astype(numpy.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+
+        # Rows behind the camera are NaN
+        locs = camera_info.world_to_viewport_batch(coords).reshape(3, point_count, 2)
+        in_front = ~numpy.isnan(locs[:, :, 0]).any(axis=0)
+        locs = locs[:, in_front]
+        locs[:, :, 1] = camera_info.view_height - locs[:, :, 1]
+
+        # Same as distance_point_to_plane(point, camera_pos, camera_dir) for every point
+        camera_pos = numpy.asarray(camera_info.camera_pos, dtype=numpy.float64)
+        camera_dir = numpy.asarray(camera_info.camera_dir_normalized, dtype=numpy.float64)
+        point_depths = (coords[2 * point_count:][in_front] - camera_pos) @ camera_dir
+
+        left_handles, right_handles, points = locs.tolist()
+        bezier_points = list(zip(map(tuple, left_handles), map(tuple, right_handles),
+                                 map(tuple, points)))
+        return bezier_points, point_depths
+
     @staticmethod
     def spline_to_view_curve(props, spline, world_matrix, camera_info, material = None, 
                              calc_depth = True):
@@ -3443,30 +4354,38 @@ class CurveConverter:
         camera_dir = camera_info.camera_dir
         world_to_viewport = camera_info.world_to_viewport
 
-        # Goes through the spline and saves transformed bezier points and their handles
-        for point in spline.bezier_points:
-            point_loc = world_matrix @ point.co
-            vert_loc = world_to_viewport(point_loc)
+        # Converts all points and handles at once if possible
+        projected = CurveConverter.project_bezier_points(spline, world_matrix, camera_info)
+        if projected is not None:
+            bezier_points, point_depths = projected
+            if calc_depth and len(point_depths) > 0:
+                min_depth = float(point_depths.min())
+                max_depth = float(point_depths.max())
+        else:
+            # Goes through the spline and saves transformed bezier points and their handles
+            for point in spline.bezier_points:
+                point_loc = world_matrix @ point.co
+                vert_loc = world_to_viewport(point_loc)
 
-            handle_left = world_to_viewport(world_matrix @ point.handle_left)
-            
-            handle_right = world_to_viewport(world_matrix @ point.handle_right)
+                handle_left = world_to_viewport(world_matrix @ point.handle_left)
+                
+                handle_right = world_to_viewport(world_matrix @ point.handle_right)
 
-            # If any point or handle is behind the camera, skips current point
-            if (vert_loc is None) or (handle_left is None) or (handle_right is None):
-                continue
+                # If any point or handle is behind the camera, skips current point
+                if (vert_loc is None) or (handle_left is None) or (handle_right is None):
+                    continue
 
-            # Calculates depth
-            if calc_depth:
-                point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
-                max_depth = max(max_depth, point_depth)
-                min_depth = min(min_depth, point_depth)
+                # Calculates depth
+                if calc_depth:
+                    point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
+                    max_depth = max(max_depth, point_depth)
+                    min_depth = min(min_depth, point_depth)
 
-            transformed_bezier_point = ((handle_left[0], view_height - handle_left[1]),
-                                        (handle_right[0], view_height - handle_right[1]),
-                                        (vert_loc[0], view_height - vert_loc[1]))
+                transformed_bezier_point = ((handle_left[0], view_height - handle_left[1]),
+                                            (handle_right[0], view_height - handle_right[1]),
+                                            (vert_loc[0], view_height - vert_loc[1]))
 
-            bezier_points.append(transformed_bezier_point)
+                bezier_points.append(transformed_bezier_point)
 
         # If not enough points have been converted to form a curve, skips it entirely
         if len(bezier_points) < 2:
@@ -3740,14 +4659,18 @@ class TextConverter:
 
         # Creates a bmesh from a mesh conversion copy of the text object 
         # and transforms it into view
+        text_mesh = obj.to_mesh()
         obj_mesh = bmesh.new()
-        obj_mesh.from_mesh(obj.to_mesh())
+        obj_mesh.from_mesh(text_mesh)
         obj_mesh.transform(matrix_world)
+        obj_mesh.verts.index_update()
+        vert_coords = MeshConverter.read_mesh_arrays(text_mesh, matrix_world)[0]
+        vert_coords_2d = MeshConverter.project_verts(vert_coords, camera_info)
 
         # Saves every face of the bmesh as a viewpolygon to the list
         for face in obj_mesh.faces:
-            # Transforms the normal of the face from local to world coordinates
-            view_polygon = MeshConverter.mesh_shape_to_view_polygon(props, face, camera_info)
+            view_polygon = MeshConverter.mesh_shape_to_view_polygon(props, face, camera_info,
+                                                                    vert_coords_2d)
             if view_polygon is not None:
                 polygons.append(view_polygon)
         obj.to_mesh_clear()
@@ -3831,6 +4754,52 @@ class GreasePencilConverter:
     """Class containing methods for converting grease pencils into ViewCurveGroup instances
     """
 
+    @staticmethod
+    def project_stroke_points(stroke, world_matrix, camera_info):
+        """Converts all points of the stroke to viewport at once, 
+        points behind the camera are skipped
+
+        :param stroke: Stroke of the GP object or annotation
+        :type stroke: bpy.types.GPencilStroke
+        :param world_matrix: World matrix used to transform the points, 
+        None if the points are already in world coordinates
+        :type world_matrix: float[4][4] or None
+        :param camera_info: Information about the camera used to generate this body
+        :type camera_info: CameraInfo
+        :return: Transformed points as bezier points without handles and depths of the points, 
+        None if batch conversion is unavailable
+        :rtype: (List of (None, None, (float, float)), numpy.ndarray) or None
+        """
+        if camera_info.world_to_viewport_batch is None:
+            return None
+
+        stroke_points = stroke.points
+        point_count = len(stroke_points)
+        if point_count == 0:
+            return [], numpy.empty(0, dtype=numpy.float64)
+
+        # Reads the points (single precision) and transforms them to world coordinates in double
+        coords = numpy.empty(point_count * 3, dtype=numpy.float32)
+        stroke_points.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3).astype(numpy.float64)
+        if world_matrix is not None:
+            matrix = numpy.array(world_matrix, dtype=numpy.float64)
+            coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+        # Rows behind the camera are NaN
+        locs = camera_info.world_to_viewport_batch(coords)
+        in_front = ~numpy.isnan(locs[:, 0])
+        locs = locs[in_front]
+        locs[:, 1] = camera_info.view_height - locs[:, 1]
+
+        # Same as distance_point_to_plane(point, camera_pos, camera_dir) for every point
+        camera_pos = numpy.asarray(camera_info.camera_pos, dtype=numpy.float64)
+        camera_dir = numpy.asarray(camera_info.camera_dir_normalized, dtype=numpy.float64)
+        point_depths = (coords[in_front] - camera_pos) @ camera_dir
+
+        bezier_points = [(None, None, point) for point in map(tuple, locs.tolist())]
+        return bezier_points, point_depths
+
     @staticmethod
     def gpencil_stroke_to_view_curve(props, stroke, world_matrix, material_slots, camera_info):
         """Converts the stroke of a GP object into a ViewCurve instance
@@ -3856,25 +4825,33 @@ class GreasePencilConverter:
         camera_dir = camera_info.camera_dir
         world_to_viewport = camera_info.world_to_viewport
 
-        # Goes through the stroke points and saves transformed points
-        for point in stroke.points:
-            point_loc = world_matrix @ point.co
-            vert_loc = world_to_viewport(point_loc)
+        # Converts all points at once if possible
+        projected = GreasePencilConverter.project_stroke_points(stroke, world_matrix, camera_info)
+        if projected is not None:
+            bezier_points, point_depths = projected
+            if len(point_depths) > 0:
+                min_depth = float(point_depths.min())
+                max_depth = float(point_depths.max())
+        else:
+            # Goes through the stroke points and saves transformed points
+            for point in stroke.points:
+                point_loc = world_matrix @ point.co
+                vert_loc = world_to_viewport(point_loc)
 
-            # If any point is behind the camera, skips current point
-            if (vert_loc is None):
-                continue
+                # If any point is behind the camera, skips current point
+                if (vert_loc is None):
+                    continue
 
-            # Calculates depth
-            point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
-            max_depth = max(max_depth, point_depth)
-            min_depth = min(min_depth, point_depth)
+                # Calculates depth
+                point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
+                max_depth = max(max_depth, point_depth)
+                min_depth = min(min_depth, point_depth)
 
-            transformed_bezier_point = (None,
-                                        None,
-                                        (vert_loc[0], view_height - vert_loc[1]))
+                transformed_bezier_point = (None,
+                                            None,
+                                            (vert_loc[0], view_height - vert_loc[1]))
 
-            bezier_points.append(transformed_bezier_point)
+                bezier_points.append(transformed_bezier_point)
 
         # If not enough points have been converted to form a curve, skips it entirely
         if len(bezier_points) < 2:
@@ -4092,35 +5069,47 @@ class AnnotationConverter:
         camera_dir = camera_info.camera_dir
         world_to_viewport = camera_info.world_to_viewport
 
-        # Goes through the stroke points and saves points
-        for point in stroke.points:
-
+        # Converts all points at once if possible, annotations sticked to the view 
+        # are converted point by point
+        projected = None
+        if stroke.display_mode != "SCREEN":
             # No transformation needed, annotation points are saved in world coordinates
-            point_loc = point.co
-            transformed_bezier_point = None
+            projected = GreasePencilConverter.project_stroke_points(stroke, None, camera_info)
+        if projected is not None:
+            bezier_points, point_depths = projected
+            if len(point_depths) > 0:
+                min_depth = float(point_depths.min())
+                max_depth = float(point_depths.max())
+        else:
+            # Goes through the stroke points and saves points
+            for point in stroke.points:
 
-            # If annotation is sticked to the view, calculates differently
-            if stroke.display_mode == "SCREEN":
-                vert_loc = [point_loc[0] * view_width / 100.0, view_height * point_loc[1] / 100.0]
+                # No transformation needed, annotation points are saved in world coordinates
+                point_loc = point.co
+                transformed_bezier_point = None
+
+                # If annotation is sticked to the view, calculates differently
+                if stroke.display_mode == "SCREEN":
+                    vert_loc = [point_loc[0] * view_width / 100.0, view_height * point_loc[1] / 100.0]
                 
-                max_depth = 0
-                min_depth = 0
+                    max_depth = 0
+                    min_depth = 0
 
-                transformed_bezier_point = (None, None, (vert_loc[0], view_height - vert_loc[1]))
-            else:
-                vert_loc = world_to_viewport(point_loc)
+                    transformed_bezier_point = (None, None, (vert_loc[0], view_height - vert_loc[1]))
+                else:
+                    vert_loc = world_to_viewport(point_loc)
 
-                # If any point is behind the camera, skips current point
-                if (vert_loc is None):
-                    continue
+                    # If any point is behind the camera, skips current point
+                    if (vert_loc is None):
+                        continue
 
-                point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
-                max_depth = max(max_depth, point_depth)
-                min_depth = min(min_depth, point_depth)
+                    point_depth = distance_point_to_plane(point_loc, camera_pos, camera_dir)
+                    max_depth = max(max_depth, point_depth)
+                    min_depth = min(min_depth, point_depth)
 
-                transformed_bezier_point = (None, None, (vert_loc[0], view_height - vert_loc[1]))
+                    transformed_bezier_point = (None, None, (vert_loc[0], view_height - vert_loc[1]))
 
-            bezier_points.append(transformed_bezier_point)
+                bezier_points.append(transformed_bezier_point)
 
         # If not enough points have been converted to form a curve, skips it entirely
         if len(bezier_points) < 2:
@@ -4201,7 +5190,7 @@ class AnnotationConverter:
         # Priority layers are not sorted, their order is based on the annotation layers order
         if not priority:
             sort_option = EnumPropertyDictionaries.global_sorting[props.global_sorting_option]
-            anns.sort(key = lambda element: element.get_depth(sort_option), reverse = True)
+            DepthSorter.depth_sort_view_types(anns, sort_option)
 
         return anns
 
@@ -4220,7 +5209,64 @@ class DepthSorter:
         :param view_polygons: Polygons to sort
         :type view_polygons: List of ViewPolygon instances
         """
-        view_polygons.sort(key = lambda polygon: polygon.depth, reverse = True)
+        keys = numpy.fromiter((polygon.depth for polygon in view_polygons),
+                              dtype=numpy.float64, count=len(view_polygons))
+        DepthSorter.reorder_by_keys(view_polygons, keys, True)
+
+    @staticmethod
+    def reorder_by_keys(view_polygons, keys, descending):
+        """Stable sort of polygons by precomputed keys, the keys are sorted by NumPy 
+        instead of calling a key function for every polygon
+
+        :param view_polygons: Polygons to sort (sorted in place)
+        :type view_polygons: List of ViewPolygon instances
+        :param keys: Sort key of every polygon
+        :type keys: numpy.ndarray of shape (n,)
+        :param descending: Sorts from the highest key if True, from the lowest if False
+        :type descending: bool
+        """
+        # Stable in both directions, same as list.sort(reverse = descending)
+        order = numpy.argsort(-keys if descending else keys, kind="stable")
+        # Python ints index the list faster than NumPy integers
+        view_polygons[:] = [view_polygons[i] for i in order.tolist()]
+
+    @staticmethod
+    def get_depth_keys(view_types, sort_option):
+        """Gets depths of all elements at once from an array of their bounds, 
+        same values as get_depth() of every element
+
+        :param view_types: Elements to get the depths of
+        :type view_types: List of ViewType
+        :param sort_option: 1 for zMin, 2 for zMax, 3 for zMiddle
+        :type sort_option: int
+        :raises TypeError: Raised when unsupported option is given
+        :return: Depth of every element
+        :rtype: numpy.ndarray of shape (n,)
+        """
+        bounds = numpy.array([element.bounds for element in view_types], dtype=numpy.float64)
+        if sort_option == 1:
+            return bounds[:, 4]
+        elif sort_option == 2:
+            return bounds[:, 5]
+        elif sort_option == 3:
+            return (bounds[:, 4] + bounds[:, 5]) / 2.0
+        else:
+            raise TypeError("Invalid sorting option")
+
+    @staticmethod
+    def depth_sort_view_types(view_types, sort_option):
+        """Sorts elements from the greatest depth, same order as sorting them by get_depth() 
+        with a key function, but with all the keys computed by get_depth_keys()
+
+        :param view_types: Elements to sort (sorted in place)
+        :type view_types: List of ViewType
+        :param sort_option: 1 for zMin, 2 for zMax, 3 for zMiddle
+        :type sort_option: int
+        :raises TypeError: Raised when unsupported option is given
+        """
+        if len(view_types) > 0:
+            DepthSorter.reorder_by_keys(view_types, 
+                                        DepthSorter.get_depth_keys(view_types, sort_option), True)
 
     @staticmethod
     def depth_sort_bb_depth(view_polygons, sorting_heuristic):
@@ -4233,22 +5279,54 @@ class DepthSorter:
         :raises TypeError: Raised when unsupported heuristic is given
         """
         sort_option = EnumPropertyDictionaries.polygon_sorting[sorting_heuristic]
+        if sort_option not in (0, 1, 2, 3):
+            raise TypeError("Invalid sorting heuristic")
+        if len(view_polygons) == 0:
+            return
+
+        # Computes sort keys of all polygons from an array of their bounds
+        bounds = numpy.vstack([polygon.bounds for polygon in view_polygons])
         if sort_option == 1:
-            view_polygons.sort(key = lambda polygon: (polygon.bounds[5] + polygon.bounds[4]) / 2.0,
-                               reverse = True)
+            keys = (bounds[:, 5] + bounds[:, 4]) / 2.0
         elif sort_option == 0:
-            view_polygons.sort(key = lambda polygon: polygon.bounds[4], reverse = True)
+            keys = bounds[:, 4]
         elif sort_option == 2:
-            view_polygons.sort(key = lambda polygon: polygon.bounds[5], reverse = True)
-        elif sort_option == 3:
-            for polygon in view_polygons:
-                depth = 0
-                for vert in polygon.verts:
-                    depth += vert[2]
-                polygon.depth = depth / len(polygon.verts)
-            view_polygons.sort(key = lambda polygon: polygon.depth, reverse = True)
+            keys = bounds[:, 5]
         else:
-            raise TypeError("Invalid sorting heuristic")
+            # Mean depth of the verts of all polygons from one concatenated array
+            verts, starts = DepthSorter.stack_verts(view_polygons)
+            counts = numpy.diff(numpy.append(starts, len(verts)))
+            keys = numpy.add.reduceat(verts[:, 2], starts) / counts
+            for polygon, depth in zip(view_polygons, keys.tolist()):
+                polygon.depth = depth
+
+        DepthSorter.reorder_by_keys(view_polygons, keys, True)
+
+    @staticmethod
+    def has_overlapping_boxes(view_polygons):
+        """Checks whether the bounding boxes of any two polygons overlap (touching is not overlap), 
+        polygons with disjoint boxes are either separated in the projection or in depth, 
+        so sorting them by depth is enough and no polygons have to be cut
+
+        :param view_polygons: Checked polygons
+        :type view_polygons: List of ViewPolygon instances
+        :return: True if at least one pair of bounding boxes overlaps, False otherwise
+        :rtype: bool
+        """
+        if len(view_polygons) < 2:
+            return False
+
+        # Sweeps over the boxes ordered by xMin, only the boxes starting before the end 
+        # of a box in x are compared with it (all columns at once, stops at the first overlap)
+        bounds = numpy.vstack([polygon.bounds for polygon in view_polygons])
+        bounds = bounds[numpy.argsort(bounds[:, 0], kind="stable")]
+        x_ends = numpy.searchsorted(bounds[:, 0], bounds[:, 1], side="left")
+        for i in numpy.flatnonzero(x_ends > numpy.arange(1, len(bounds) + 1)).tolist():
+            box = bounds[i]
+            others = bounds[i + 1:x_ends[i]]
+            if ((others[:, 0::2] < box[1::2]) & (others[:, 1::2] > box[0::2])).all(axis=1).any():
+                return True
+        return False
 
     @staticmethod
     def depth_sort_bsp(view_polygons, cycle_limit):
@@ -4267,7 +5345,8 @@ class DepthSorter:
         if len(view_polygons) == 0:
             return root
         else:
-            root.polygon_list.append(view_polygons.pop(round(len(view_polygons) / 2)))
+            splitter_index = DepthSorter.choose_splitter(view_polygons)
+            root.polygon_list.append(view_polygons.pop(splitter_index))
         root_plane = root.polygon_list[0]
 
         # There is only one polygon
@@ -4276,30 +5355,9 @@ class DepthSorter:
 
         root.is_leaf = False
 
-        # First partition
-        for i in range(len(view_polygons) - 1, -1, -1):
-            pos = DepthSorter.relative_pos(root_plane, view_polygons[i])
-            if pos == 1:
-                if root.front_node is None:
-                    root.front_node = BSPNode()
-                root.front_node.polygon_list.append(view_polygons.pop(i))
-            elif pos == 0:
-                # Cuts in two and culls small fragments
-                cut_polygons = DepthSorter.cut_conflicting(root_plane, view_polygons.pop(i))
-
-                if cut_polygons[0] is not None:
-                    if root.front_node is None:
-                        root.front_node = BSPNode()
-                    root.front_node.polygon_list.append(cut_polygons[0])
-
-                if cut_polygons[1] is not None:
-                    if root.back_node is None:
-                        root.back_node = BSPNode()
-                    root.back_node.polygon_list.append(cut_polygons[1])
-            else:
-                if root.back_node is None:
-                    root.back_node = BSPNode()
-                root.back_node.polygon_list.append(view_polygons.pop(i))
+        # First partition, all polygons are moved to the children of the root
+        DepthSorter.partition_polygons(root, root_plane, view_polygons)
+        view_polygons.clear()
 
         # Initializes the leaf node list
         leaf_nodes = list()
@@ -4330,59 +5388,139 @@ class DepthSorter:
         """
         changed = False
         for bsp_node in bsp_nodes:
-            view_polygons = bsp_node.polygon_list
             # Splits the node if it has more than one polygon
-            if len(view_polygons) > 1:
-                # Pops the partitioning polygon to a temp var
-                part_plane = view_polygons.pop(round(len(view_polygons) / 2))
-
-                bsp_node.is_leaf = False
+            if len(bsp_node.polygon_list) > 1:
+                DepthSorter.partition_node(bsp_node)
                 changed = True
 
-                # Splits
-                for i in range(len(view_polygons) - 1, -1, -1):
-                    pos = DepthSorter.relative_pos(part_plane, view_polygons[i])
-
-                    if pos == 1:
-                        if bsp_node.front_node is None:
-                            bsp_node.front_node = BSPNode()
-                        bsp_node.front_node.polygon_list.append(view_polygons.pop(i))
-                    elif pos == 0:
-                        # Cuts in two and culls small fragments
-                        cut_polygons = DepthSorter.cut_conflicting(part_plane, view_polygons.pop(i))
-
-                        if cut_polygons[0] is not None:
-                            if bsp_node.front_node is None:
-                                bsp_node.front_node = BSPNode()
-                            bsp_node.front_node.polygon_list.append(cut_polygons[0])
-
-                        if cut_polygons[1] is not None:
-                            if bsp_node.back_node is None:
-                                bsp_node.back_node = BSPNode()
-                            bsp_node.back_node.polygon_list.append(cut_polygons[1])
-                    else:
-                        if bsp_node.back_node is None:
-                            bsp_node.back_node = BSPNode()
-                        bsp_node.back_node.polygon_list.append(view_polygons.pop(i))
-
-                # Appends the partitioning polygon back to this node
-                view_polygons.append(part_plane)
-
-        # Deletes non-leaf nodes from the list and appends new leaf nodes
-        for i in range(len(bsp_nodes) - 1, -1, -1):
-            node = bsp_nodes[i]
+        # Replaces non-leaf nodes in the list by their children
+        # (rebuilt instead of deleting items one by one, each deletion shifts the list)
+        new_leaf_nodes = list()
+        for node in reversed(bsp_nodes):
             if not node.is_leaf:
                 if node.front_node is not None:
-                    bsp_nodes.append(node.front_node)
+                    new_leaf_nodes.append(node.front_node)
                 if node.back_node is not None:
-                    bsp_nodes.append(node.back_node)
-                del bsp_nodes[i]
+                    new_leaf_nodes.append(node.back_node)
+        bsp_nodes[:] = [node for node in bsp_nodes if node.is_leaf] + new_leaf_nodes
 
         return changed
 
+    @staticmethod
+    def partition_node(bsp_node):
+        """Splits a leaf node with more than one polygon, only the partitioning polygon 
+        stays in the node, the other polygons are moved to its children
+
+        :param bsp_node: Node to split
+        :type bsp_node: BSPNode
+        """
+        view_polygons = bsp_node.polygon_list
+        # Pops the partitioning polygon to a temp var
+        part_plane = view_polygons.pop(DepthSorter.choose_splitter(view_polygons))
+
+        bsp_node.is_leaf = False
+
+        # Splits, only the partitioning polygon stays in this node
+        DepthSorter.partition_polygons(bsp_node, part_plane, view_polygons)
+        view_polygons.clear()
+        view_polygons.append(part_plane)
+
+    @staticmethod
+    def choose_splitter(view_polygons):
+        """Chooses the partitioning polygon out of a few candidates (the polygons at the median, 
+        thirds, minimum and maximum of the depths of the node) by the number of polygons 
+        on both sides and the number of polygons it would cut
+
+        :param view_polygons: Polygons of the partitioned node
+        :type view_polygons: List of ViewPolygon instances
+        :return: Index of the chosen partitioning polygon
+        :rtype: int
+        """
+        polygon_count = len(view_polygons)
+        if polygon_count <= 2:
+            return 0
+
+        # Finds the polygons at the depth quantiles in linear time (no sort of the whole node), 
+        # a splitter at the median depth keeps both sides balanced and the tree shallow
+        depths = numpy.vstack([polygon.bounds for polygon in view_polygons])[:, 5]
+        ranks = sorted({0, polygon_count // 3, polygon_count // 2, 2 * polygon_count // 3,
+                        polygon_count - 1})
+        order = numpy.argpartition(depths, ranks)
+        middle = int(order[polygon_count // 2])
+        if polygon_count <= 3:
+            return middle
+
+        # Scores are estimated on evenly spaced polygons for large nodes
+        step = max(1, polygon_count // BSP_SPLITTER_SAMPLE_SIZE)
+        sample = view_polygons[::step]
+
+        # The median polygon is scored first and wins ties
+        candidates = [middle] + [int(order[rank]) for rank in ranks 
+                                 if rank != polygon_count // 2]
+        best_index = middle
+        best_score = None
+        stacked_sample = DepthSorter.stack_verts(sample)
+        for index in candidates:
+            part_plane = view_polygons[index]
+            # The partitioning polygon itself is not counted
+            others = numpy.array([polygon is not part_plane for polygon in sample])
+            positions = DepthSorter.relative_pos_batch(part_plane, stacked_sample)[others]
+            front_count = int((positions == 1).sum())
+            back_count = int((positions == -1).sum())
+            spanning_count = int((positions == 0).sum())
+
+            # Cut polygons are penalized, unbalanced sides make the tree deeper
+            score = (abs(front_count - back_count) + 
+                     BSP_SPLIT_PENALTY * spanning_count)
+            if best_score is None or score < best_score:
+                best_index = index
+                best_score = score
+        return best_index
+
+    @staticmethod
+    def partition_polygons(bsp_node, part_plane, view_polygons):
+        """Sorts polygons into the front and back child of a node by the partitioning plane,
+        polygons crossing the plane are cut (the list of polygons is NOT modified)
+
+        :param bsp_node: Partitioned node, children are created when needed
+        :type bsp_node: BSPNode
+        :param part_plane: Polygon defining the partitioning plane
+        :type part_plane: ViewPolygon
+        :param view_polygons: Polygons to partition
+        :type view_polygons: List of ViewPolygon instances
+        """
+        front_polygons = list()
+        back_polygons = list()
+        # Goes from the last polygon to keep the order the polygons were popped in before
+        polygons = view_polygons[::-1]
+        positions = DepthSorter.relative_pos_batch(part_plane, 
+                                                   DepthSorter.stack_verts(polygons))
+        for polygon, pos in zip(polygons, positions.tolist()):
+            if pos == 1:
+                front_polygons.append(polygon)
+            elif pos == 0:
+                # Cuts in two and culls small fragments
+                cut_polygons = DepthSorter.cut_conflicting(part_plane, polygon)
+                if cut_polygons[0] is not None:
+                    front_polygons.append(cut_polygons[0])
+                if cut_polygons[1] is not None:
+                    back_polygons.append(cut_polygons[1])
+            else:
+                back_polygons.append(polygon)
+
+        # Creates only the children that get any polygons
+        if len(front_polygons) > 0:
+            if bsp_node.front_node is None:
+                bsp_node.front_node = BSPNode()
+            bsp_node.front_node.polygon_list.extend(front_polygons)
+        if len(back_polygons) > 0:
+            if bsp_node.back_node is None:
+                bsp_node.back_node = BSPNode()
+            bsp_node.back_node.polygon_list.extend(back_polygons)
+
     @staticmethod
     def bsp_tree_to_view_polygons(root, view_polygons, camera_pos):
-        """Recursively traverses the bsp tree and appends polygons to the final list
+        """Traverses the bsp tree and appends polygons to the final list
 
         :param root: Root node of the BSP tree
         :type root: BSPNode
@@ -4391,26 +5529,36 @@ class DepthSorter:
         :param camera_pos: Position of the camera in the scene
         :type camera_pos: float[3]
         """
-        if root is None:
-            return
-        if root.is_leaf:
-            view_polygons.append(root.polygon_list[0])
-        else:
+        # Explicit stack instead of recursion (deep trees would reach the recursion limit),
+        # the flag marks nodes whose subtrees are already scheduled
+        camera_pos = numpy.asarray(camera_pos, dtype=numpy.float64)
+        append_polygon = view_polygons.append
+        stack = [(root, False)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            node, expanded = pop()
+            if node.is_leaf or expanded:
+                append_polygon(node.polygon_list[0])
+                continue
+
             # Checks if the camera is in front or back of this polygon plane
-            plane_point = root.polygon_list[0].verts[0]
-            dir_vector = Vector((plane_point[0] - camera_pos[0],
-                                 plane_point[1] - camera_pos[1],
-                                 plane_point[2] - camera_pos[2]))
-            if dir_vector @ root.polygon_list[0].normal < 0:
-                # In front
-                DepthSorter.bsp_tree_to_view_polygons(root.back_node, view_polygons, camera_pos)
-                view_polygons.append(root.polygon_list[0])
-                DepthSorter.bsp_tree_to_view_polygons(root.front_node, view_polygons, camera_pos)
+            # (signed distance from the cached plane, no Vector per node)
+            normal, offset = node.polygon_list[0].get_plane()
+            if normal @ camera_pos + offset > 0:
+                # In front: back subtree, node, front subtree
+                near_node, far_node = node.front_node, node.back_node
             else:
-                # Behind
-                DepthSorter.bsp_tree_to_view_polygons(root.front_node, view_polygons, camera_pos)
-                view_polygons.append(root.polygon_list[0])
-                DepthSorter.bsp_tree_to_view_polygons(root.back_node, view_polygons, camera_pos)
+                # Behind: front subtree, node, back subtree
+                near_node, far_node = node.back_node, node.front_node
+
+            # Pushed in reverse, the last pushed node is visited first, 
+            # missing children are never pushed
+            if near_node is not None:
+                push((near_node, False))
+            push((node, True))
+            if far_node is not None:
+                push((far_node, False))
 
 
     @staticmethod
@@ -4422,13 +5570,19 @@ class DepthSorter:
         :param viewpoint_pos: Viewpoint, position of the camera
         :type viewpoint_pos: float[3]
         """
-        for polygon in view_polygons:
-            plane_point = polygon.verts[0]
-            dir_vector = Vector((viewpoint_pos[0] - plane_point[0],
-                                 viewpoint_pos[1] - plane_point[1],
-                                 viewpoint_pos[2] - plane_point[2]))
-            if dir_vector @ polygon.normal > 0:
-                polygon.normal.negate()
+        if len(view_polygons) == 0:
+            return
+
+        # Directions from the first vert of every polygon to the viewpoint and the normals
+        # as (n, 3) arrays, all dot products are calculated at once
+        plane_points = numpy.vstack([polygon.verts[0] for polygon in view_polygons])
+        normals = numpy.vstack([polygon.normal for polygon in view_polygons])
+        dir_vectors = numpy.asarray(viewpoint_pos, dtype=numpy.float64) - plane_points
+        negated = numpy.einsum("ij,ij->i", dir_vectors, normals) > 0
+
+        for i in numpy.flatnonzero(negated).tolist():
+            view_polygons[i].normal = -normals[i]
+            view_polygons[i].plane = None
 
     @staticmethod
     def is_fragment(view_polygon):
@@ -4442,14 +5596,14 @@ class DepthSorter:
         if len(view_polygon.verts) < 3:
             return True
 
-        difference_sum = 0
-        for i in range(0, len(view_polygon.verts) - 1):
-            difference_sum += numpy.abs(view_polygon.verts[i][0] - view_polygon.verts[i + 1][0]) +\
-                              numpy.abs(view_polygon.verts[i][1] - view_polygon.verts[i + 1][1]) +\
-                              numpy.abs(view_polygon.verts[i][2] - view_polygon.verts[i + 1][2])
+        # Sum of coordinate differences of all consecutive verts (one loop or one array operation)
+        if NUMBA_AVAILABLE:
+            difference_sum = perimeter_l1_kernel(view_polygon.verts)
+        else:
+            difference_sum = float(numpy.abs(numpy.diff(view_polygon.verts, axis=0)).sum())
 
         # If the total sum of coordinate differences is extremely small, considers this a fragment
-        if numpy.abs(difference_sum) < POLYGON_CULL_THRESHOLD:
+        if difference_sum < POLYGON_CULL_THRESHOLD:
             return True
         return False
 
@@ -4464,8 +5618,9 @@ class DepthSorter:
         :return: Returns -1 if behind plane, 0 if within threshold, 1 if in front of plane
         :rtype: int -1/0/1
         """
-        distance = distance_point_to_plane(vert, plane_polygon.verts[0], plane_polygon.normal)
-        if numpy.abs(distance) < PLANE_DISTANCE_THRESHOLD:
+        normal, offset = plane_polygon.get_plane()
+        distance = normal @ numpy.asarray(vert, dtype=numpy.float64) + offset
+        if abs(distance) < PLANE_DISTANCE_THRESHOLD:
             return 0
         elif distance > 0:
             return 1
@@ -4483,12 +5638,9 @@ class DepthSorter:
         :return: Returns false if behind the polygon, true if in front
         :rtype: bool
         """
-        plane_point = plane_polygon.verts[0]
-        dir_vector = Vector((vert[0] - plane_point[0],
-                             vert[1] - plane_point[1],
-                             vert[2] - plane_point[2]))
-        dot_product = dir_vector @ plane_polygon.normal
-        if dot_product >= 0:
+        normal, offset = plane_polygon.get_plane()
+        distance = normal @ numpy.asarray(vert, dtype=numpy.float64) + offset
+        if distance >= 0:
             return True
         else:
             return False
@@ -4504,14 +5656,11 @@ class DepthSorter:
         :return: Returns -1 if p is behind the plane, 0 if in collision, 1 if in front
         :rtype: int -1/0/1
         """
-        all_front = True
-        all_back = True
-        for vert in polygon_p.verts:
-            vert_rel_pos = DepthSorter.vert_relative_pos(plane_polygon, vert)
-            if vert_rel_pos == 1:
-                all_back = False
-            elif vert_rel_pos == -1:
-                all_front = False
+        # Signed distances of all verts from the cached plane at once
+        normal, offset = plane_polygon.get_plane()
+        distances = polygon_p.verts @ normal + offset
+        all_front = not (distances <= -PLANE_DISTANCE_THRESHOLD).any()
+        all_back = not (distances >= PLANE_DISTANCE_THRESHOLD).any()
 
         if all_front:
             return 1
@@ -4520,6 +5669,47 @@ class DepthSorter:
         else:
             return 0
 
+    @staticmethod
+    def stack_verts(view_polygons):
+        """Concatenates verts of all polygons into one array for relative_pos_batch()
+
+        :param view_polygons: Polygons (every one with at least one vert)
+        :type view_polygons: List of ViewPolygon
+        :return: Verts of all polygons and the index of the first vert of every polygon
+        :rtype: (numpy.ndarray of shape (n, 3), numpy.ndarray of int)
+        """
+        if len(view_polygons) == 0:
+            return (numpy.zeros((0, 3), dtype=numpy.float64), numpy.zeros(0, dtype=numpy.intp))
+        counts = numpy.array([len(polygon.verts) for polygon in view_polygons])
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+        return (numpy.concatenate([polygon.verts for polygon in view_polygons]), starts)
+
+    @staticmethod
+    def relative_pos_batch(plane_polygon, stacked_verts):
+        """Checks the relative position of many polygons and a plane defined by another polygon,
+        same as relative_pos() for every polygon, but with a single matrix product
+
+        :param plane_polygon: Polygon that defines the plane
+        :type plane_polygon: ViewPolygon
+        :param stacked_verts: Verts of the checked polygons (from stack_verts())
+        :type stacked_verts: (numpy.ndarray of shape (n, 3), numpy.ndarray of int)
+        :return: -1 if behind the plane, 0 if in collision, 1 if in front, for every polygon
+        :rtype: numpy.ndarray of int
+        """
+        verts, starts = stacked_verts
+        if len(starts) == 0:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        normal, offset = plane_polygon.get_plane()
+        if NUMBA_AVAILABLE:
+            return relative_pos_kernel(verts, starts, normal, offset, PLANE_DISTANCE_THRESHOLD)
+
+        # Signed distances of the verts of all polygons at once, reduced per polygon
+        distances = verts @ normal + offset
+        any_back = numpy.logical_or.reduceat(distances <= -PLANE_DISTANCE_THRESHOLD, starts)
+        any_front = numpy.logical_or.reduceat(distances >= PLANE_DISTANCE_THRESHOLD, starts)
+        return numpy.where(~any_back, 1, numpy.where(~any_front, -1, 0))
+
     @staticmethod
     def relative_pos_bool(plane_polygon, polygon_p):
         """Checks the relative position of NON-CONFLICTING polygons
@@ -4532,14 +5722,11 @@ class DepthSorter:
         :return: Returns false if p is behind the plane polygon, true if in front
         :rtype: bool
         """
-        all_front = True
-        all_back = True
-        for vert in polygon_p.verts:
-            vert_rel_pos = DepthSorter.vert_relative_pos(plane_polygon, vert)
-            if vert_rel_pos == 1:
-                all_back = False
-            elif vert_rel_pos == -1:
-                all_front = False
+        # Signed distances of all verts from the cached plane at once
+        normal, offset = plane_polygon.get_plane()
+        distances = polygon_p.verts @ normal + offset
+        all_front = not (distances <= -PLANE_DISTANCE_THRESHOLD).any()
+        all_back = not (distances >= PLANE_DISTANCE_THRESHOLD).any()
 
         if all_front:
             return True
@@ -4581,76 +5768,48 @@ class DepthSorter:
         :return: Returns both fragments, None instead of a fragment if the fragment is too small
         :rtype: (ViewPolygon, ViewPolygon), where ViewPolygon can be ViewPolygon instance or None
         """
-        back_pol_verts = list()
-        front_pol_verts = list()
         verts = polygon_p.verts
 
-        # Checks the last vertex first for the context
-        currently_in_front = DepthSorter.vert_relative_pos_bool(plane_polygon, verts[-1])
-        for i, vert in enumerate(verts):
-            if DepthSorter.vert_relative_pos_bool(plane_polygon, vert):
-                # If vert is in front
-                if currently_in_front:
-                    # And last vert was also in front, appends to front
-                    front_pol_verts.append(vert)
-                else:
-                    # And last vert was not in front, appends intersection to both
-                    # and vert to front
-                    currently_in_front = True
-                    next_vert = verts[(i - 1) % len(verts)]
-                    # Direction of the intersection, does not cut exactly on plane but close to it
-                    intersect_dir = Vector((next_vert[0] - vert[0],
-                                    next_vert[1] - vert[1],
-                                    next_vert[2] - vert[2])).normalized() / POLYGON_CUT_PRECISION
-                    try:
-                        intersect_vert = intersect_line_plane(Vector(vert),
-                                                              Vector(next_vert),
-                                                              plane_polygon.verts[0],
-                                                              plane_polygon.normal)
-                        back_pol_verts.append((intersect_vert[0] + intersect_dir[0],
-                                               intersect_vert[1] + intersect_dir[1],
-                                               intersect_vert[2] + intersect_dir[2]))
-                        front_pol_verts.append((intersect_vert[0] - intersect_dir[0],
-                                                intersect_vert[1] - intersect_dir[1],
-                                                intersect_vert[2] - intersect_dir[2]))
-                        front_pol_verts.append(vert)
-                    except TypeError:
-                        back_pol_verts.append(vert)
-                        front_pol_verts.append(vert)
-            else:
-                # If vert is behind
-                if currently_in_front:
-                    # And last vert was not behind, appends intersection to both
-                    # and vert to back
-                    currently_in_front = False
-                    next_vert = verts[(i - 1) % len(verts)]
-                    # Direction of the intersection, does not cut exactly on plane but close to it
-                    intersect_dir = Vector((next_vert[0] - vert[0],
-                                    next_vert[1] - vert[1],
-                                    next_vert[2] - vert[2])).normalized() / POLYGON_CUT_PRECISION
-                    try:
-                        intersect_vert = intersect_line_plane(Vector(vert),
-                                                              Vector(next_vert),
-                                                              plane_polygon.verts[0],
-                                                              plane_polygon.normal)
-                        front_pol_verts.append((intersect_vert[0] + intersect_dir[0],
-                                                intersect_vert[1] + intersect_dir[1],
-                                                intersect_vert[2] + intersect_dir[2]))
-                        back_pol_verts.append((intersect_vert[0] - intersect_dir[0],
-                                               intersect_vert[1] - intersect_dir[1],
-                                               intersect_vert[2] - intersect_dir[2]))
-                        back_pol_verts.append(vert)
-                    except TypeError:
-                        front_pol_verts.append(vert)
-                        back_pol_verts.append(vert)
-                else:
-                    # And last vert was also behind, appends to back
-                    back_pol_verts.append(vert)
+        # Sides of all verts at once (same as vert_relative_pos_bool() for every vert),
+        # every vert is paired with the previous one (first vert with the last one)
+        normal, offset = plane_polygon.get_plane()
+        distances = verts @ normal + offset
+        in_front = distances >= 0
+        prev_verts = numpy.roll(verts, 1, axis=0)
+        prev_distances = numpy.roll(distances, 1)
+        crossing = in_front != numpy.roll(in_front, 1)
+
+        # Intersections of all edges with the plane, only the crossing ones are used
+        edges = prev_verts - verts
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t = distances / (distances - prev_distances)
+            # Direction of the intersection, does not cut exactly on plane but close to it
+            intersect_dirs = edges / (numpy.linalg.norm(edges, axis=1, keepdims=True) *
+                                      POLYGON_CUT_PRECISION)
+            intersections = verts + t[:, None] * edges
+            toward_prev_cut = intersections + intersect_dirs
+            toward_vert_cut = intersections - intersect_dirs
+        # Edges (nearly) parallel to the plane are not cut, the vert is used by both fragments
+        # (same tolerance as intersect_line_plane)
+        parallel = numpy.abs(distances - prev_distances) <= numpy.finfo(numpy.float32).eps
+        toward_prev = numpy.where(parallel[:, None], verts, toward_prev_cut)
+        toward_vert = numpy.where(parallel[:, None], verts, toward_vert_cut)
+
+        # The fragment on the side of the previous vert gets the intersection moved toward it,
+        # the fragment on the side of the vert gets it moved toward the vert
+        front_cuts = numpy.where(in_front[:, None], toward_vert, toward_prev)
+        back_cuts = numpy.where(in_front[:, None], toward_prev, toward_vert)
+
+        # Every vert emits [intersection, vert] to both fragments filtered by its side,
+        # an uncut parallel edge adds the vert only once to the vert's side
+        front_mask = numpy.stack((crossing & (~parallel | ~in_front), in_front), axis=1)
+        back_mask = numpy.stack((crossing & (~parallel | in_front), ~in_front), axis=1)
+        front_pol_verts = numpy.stack((front_cuts, verts), axis=1)[front_mask]
+        back_pol_verts = numpy.stack((back_cuts, verts), axis=1)[back_mask]
 
         # Creates a pair of result polygons
-        polygon_p.verts = front_pol_verts
-        polygon_q = deepcopy(polygon_p)
-        polygon_q.verts = back_pol_verts
+        polygon_q = polygon_p.clone_with_verts(back_pol_verts)
+        polygon_p.set_verts(front_pol_verts)
         # Culls fragments and recalculates bounds
         if DepthSorter.is_fragment(polygon_p):
             polygon_p = None
@@ -4730,6 +5889,58 @@ class SVGFileGenerator:
             names[layer.info] = new_name
         return names
 
+    @staticmethod
+    def view_types_to_svg(view_types, precision, svg_parts):
+        """Converts ViewType objects to svg strings in the given order and appends them to a list,
+        consecutive polygons with the same lit colour are wrapped in a <g> element 
+        that sets their fill and stroke attributes only once (never reorders the elements)
+
+        :param view_types: Elements to convert, ordered from the back to the front, 
+        only iterated once so it can be a generator producing the final order
+        :type view_types: Iterable of ViewType
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :param svg_parts: List the svg strings are appended to
+        :type svg_parts: List of str
+        """
+        append = svg_parts.append
+        # Current run of polygons with the same lit style, written when a different element comes
+        run = []
+        for element in view_types:
+            if run and isinstance(element, ViewPolygon) and run[0].has_same_style(element):
+                run.append(element)
+                continue
+
+            SVGFileGenerator.polygon_run_to_svg(run, precision, append)
+            if isinstance(element, ViewPolygon) and not element.ignored_lighting:
+                run = [element]
+            else:
+                # Other elements (and polygons styled only by their class) are written directly
+                run = []
+                append(element.to_svg(precision))
+
+        SVGFileGenerator.polygon_run_to_svg(run, precision, append)
+
+    @staticmethod
+    def polygon_run_to_svg(run, precision, append):
+        """Writes a run of polygons with the same lit style, 
+        more than one polygon is wrapped in a <g> element with the shared attributes
+
+        :param run: Polygons with the same style
+        :type run: List of ViewPolygon
+        :param precision: Number of decimal places for coordinates (1-15)
+        :type precision: int
+        :param append: Function appending a string to the svg parts
+        :type append: function
+        """
+        if len(run) == 1:
+            append(run[0].to_svg(precision))
+        elif len(run) > 1:
+            append(f"<g{run[0].get_svg_style_attributes()}>\n")
+            for polygon in run:
+                append(polygon.to_svg_class_only(precision))
+            append("</g>\n")
+
     @staticmethod
     def objects_to_svg_group(props, objects, additional_view_types, name, camera_info):
         """Generates svg <g> group from objects and returns it as string
@@ -4748,7 +5959,8 @@ class SVGFileGenerator:
         :return: Tuple of (svg_string, z_min, z_max)
         :rtype: (str, float, float)
         """
-        group_string = f" <g id=\"{name}\">\n"
+        # Parts of the group string, joined once at the end
+        group_parts = [f" <g id=\"{name}\">\n"]
 
         # Gets sort and precision option
         coord_precision = props.coord_precision
@@ -4775,38 +5987,28 @@ class SVGFileGenerator:
                 z_max = max(z_max, group[0].bounds[5])
                 z_min = min(z_min, group[-1].bounds[4])
 
-        if len(sorting_queue) > 0:
-            # Converts lists to deques for efficient popping
-            for i in range(0, len(sorting_queue)):
-                sorting_queue[i] = deque(sorting_queue[i])
-
-            # Takes the next element with the greatest depth from any type group, 
-            # writes it and removes it
-            # Continues until only 1 type group remains
-            while len(sorting_queue) > 1:
-                next_depth = -inf
-                next_group_index = 0
-
-                # Finds group with the greatest depth of the first element
-                for i, type_group in enumerate(sorting_queue):
-                    el_depth = type_group[0].get_depth(sort_option)
-                    if el_depth > next_depth:
-                        next_depth = el_depth
-                        next_group_index = i
-                
-                # Writes and pops that element from the group 
-                # (and deletes the group if it is empty)
-                group_string += sorting_queue[next_group_index].popleft().to_svg(coord_precision)
-                if len(sorting_queue[next_group_index]) == 0:
-                    del sorting_queue[next_group_index]
-
-            # Writes the remaining type group in order
-            for el in sorting_queue[0]:
-                group_string += el.to_svg(coord_precision)
-
-        group_string += f" </g> \n"
-
-        return (group_string, z_min, z_max)
+        # All elements of this group in the order they are written
+        ordered_elements = []
+        if len(sorting_queue) == 1:
+            ordered_elements = sorting_queue[0]
+        elif len(sorting_queue) > 1:
+            # Repeatedly takes the first element with the greatest depth from any type group 
+            # (the earlier group on ties), the depths of every group are computed once into 
+            # a separate key list and merged by heapq instead of calling get_depth() 
+            # on the first element of every group for every taken element,
+            # merged elements are written as they come, no combined list is created
+            keyed_groups = [zip(DepthSorter.get_depth_keys(type_group, sort_option).tolist(), 
+                                type_group)
+                            for type_group in sorting_queue]
+            ordered_elements = map(itemgetter(1), 
+                                   heapq.merge(*keyed_groups, key=itemgetter(0), reverse=True))
+
+        # Writes all elements, runs of equally lit polygons share one <g> 
+        SVGFileGenerator.view_types_to_svg(ordered_elements, coord_precision, group_parts)
+
+        group_parts.append(f" </g> \n")
+
+        return ("".join(group_parts), z_min, z_max)
 
     @staticmethod
     def collections_to_svg_groups(context, collections, camera_info):
@@ -4825,7 +6027,6 @@ class SVGFileGenerator:
         :rtype: str
         """
 
-        groups_string = ""
         props = context.scene.export_properties
         
         # Converts to a list of (name, svg_string, z_min, z_max) for every collection
@@ -4863,9 +6064,7 @@ class SVGFileGenerator:
 
 
         # Returns concatenated <g> strings
-        for col in converted_collections:
-            groups_string += col[1]
-        return groups_string
+        return "".join([col[1] for col in converted_collections])
 
     @staticmethod
     def gen_svg_head(context, camera_info):
@@ -4914,6 +6113,12 @@ class SVGFileGenerator:
         mat_rename_dict = SVGFileGenerator.get_material_dict(used_materials)
         camera_info.mat_rename_dict = mat_rename_dict
 
+        # Saves class names of animated polygons (they are never culled outside of the view)
+        camera_info.animated_class_names = set()
+        for material in set(used_materials):
+            if material is not None and material.export_svg_properties.enable_animations:
+                camera_info.animated_class_names.add("polygon_" + mat_rename_dict[material.name])
+
         # Generates style, keyframe and pattern strings for every unique material
         for material in set(used_materials):
             if material is not None:
@@ -4961,7 +6166,7 @@ class SVGFileGenerator:
         :return: File body
         :rtype: str
         """
-        body = "\n\n\n"
+        body = ["\n\n\n"]
         global STARTTIME
         STARTTIME = datetime.now()
         props = context.scene.export_properties
@@ -4980,8 +6185,8 @@ class SVGFileGenerator:
             # Converts all objects as one group                
             collection = camera_info.object_list
             group_name = "scene"
-            body += SVGFileGenerator.objects_to_svg_group(props, collection, nonprio_anns, 
-                                                          group_name, camera_info)[0]
+            body.append(SVGFileGenerator.objects_to_svg_group(props, collection, nonprio_anns, 
+                                                              group_name, camera_info)[0])
         else:
             # Creates a list of (name, objects) tuples for every collection
             collections = []
@@ -4999,9 +6204,10 @@ class SVGFileGenerator:
                     collections.append((parent_name, [obj,]))
             
             # Converts collections to svg <g> strings and appends them to body
-            body += SVGFileGenerator.collections_to_svg_groups(context, collections, camera_info)
+            body.append(SVGFileGenerator.collections_to_svg_groups(context, collections, 
+                                                                   camera_info))
 
-        return body
+        return "".join(body)
     
     @staticmethod
     def gen_svg_tail(context, camera_info):
@@ -5014,7 +6220,7 @@ class SVGFileGenerator:
         :return: File tail
         :rtype: str
         """
-        tail = ""
+        tail = []
         props = context.scene.export_properties
 
         if props.curve_convert_annotations:
@@ -5024,14 +6230,14 @@ class SVGFileGenerator:
             if props.group_by_collections:
                 for el in AnnotationConverter.convert_all_anns(props, [context.annotation_data], 
                                                                camera_info, False):
-                    tail += el.to_svg(coord_precision)
+                    tail.append(el.to_svg(coord_precision))
             for el in AnnotationConverter.convert_all_anns(props, [context.annotation_data], 
                                                            camera_info, True):
-                tail += el.to_svg(coord_precision)
+                tail.append(el.to_svg(coord_precision))
 
-        tail += "\n</svg>"
+        tail.append("\n</svg>")
 
-        return tail
+        return "".join(tail)
 
     @staticmethod
     def gen_svg_file(file_name, context, camera_info, append_name):
@@ -5048,7 +6254,8 @@ class SVGFileGenerator:
         :return: (resulting file name, result - 0 if successful 1/2/3/4/5 if error)
         :rtype: (str, int)
         """
-        content = ""
+        # Parts of the output file, joined and written at once at the end
+        content = []
 
         # Creates the final path for this camera
         path = file_name
@@ -5057,7 +6264,8 @@ class SVGFileGenerator:
 
         # Opens the file
         try:
-            f = open(path, "w", encoding = "utf-8")
+            # Binary mode, the content is encoded once instead of passing through a text wrapper
+            f = open(path, "wb", buffering = SVG_WRITE_BUFFER_SIZE)
         except FileNotFoundError:
             return (path, 1) #display_message("Output directory not found", "Error", "ERROR")
         except PermissionError:
@@ -5066,26 +6274,26 @@ class SVGFileGenerator:
             return (path, 5)
 
         # Generates output file content
-        content += SVGFileGenerator.gen_svg_head(context, camera_info)
+        content.append(SVGFileGenerator.gen_svg_head(context, camera_info))
         try:
-            content += SVGFileGenerator.gen_svg_body(context, camera_info)
+            content.append(SVGFileGenerator.gen_svg_body(context, camera_info))
         except ValueError as e:
             traceback.print_exc()
             f.close()
             return (path, 6)
         except RecursionError as e:
-            content += "</svg>"
-            f.write(content)
+            content.append("</svg>")
+            f.write("".join(content).encode("utf-8"))
             f.close()
             return (path, 3)
         except KeyboardInterrupt as e:
             f.close()
             return (path, 4) #print("Export interrupted")
         
-        content += SVGFileGenerator.gen_svg_tail(context, camera_info)
+        content.append(SVGFileGenerator.gen_svg_tail(context, camera_info))
 
         # Writes and closes output file
-        f.write(content)
+        f.write("".join(content).encode("utf-8"))
         f.close()
         return (path, 0)
 
@@ -5175,6 +6383,10 @@ class ExportSVGOperator(bpy.types.Operator):
         if path[-4:] != ".svg":
             path += ".svg"
 
+        # Compiles the numeric kernels on the first export of the session
+        # (closures of make_clip_kernel cannot be cached on disk)
+        compile_kernels()
+
         # Creates a list of all camera_infos from selected cameras
         cameras = []
         if EnumPropertyDictionaries.camera[props.viewport_camera] == 0:
@@ -5319,7 +6531,7 @@ class ExportSVGReset(bpy.types.Operator):
         props.group_by_collections = False
         props.collection_sorting_option = "coll.hier"
         
-        props.coord_precision = 1
+        props.coord_precision = 2
 
         display_message(["Settings have been reset to default"], "Success", "INFO")
 